@@ -13,6 +13,7 @@ Configuration (CLI args take precedence over env vars):
 Activities registered:
     check_constraints     — constraint checking for phase advances
     record_transition     — transition audit stub (v1 in-memory; v2 durable)
+    record_transition_batch — batched record_transition (used by EpochWorkflow)
     record_audit_event    — persist AuditEvent to configured AuditTrail
     query_audit_events    — query AuditEvents by epoch_id + optional phase
 
@@ -53,6 +54,7 @@ from aura_protocol.workflow import (
     SliceWorkflow,
     check_constraints,
     record_transition,
+    record_transition_batch,
 )
 
 logging.basicConfig(
@@ -233,6 +235,7 @@ async def run_worker(namespace: str, task_queue: str, server_address: str) -> No
         activities=[
             check_constraints,
             record_transition,
+            record_transition_batch,
             record_audit_event,
             query_audit_events,
         ],
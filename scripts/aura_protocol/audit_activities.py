@@ -21,7 +21,7 @@ Usage:
     # In a workflow:
     await workflow.execute_activity(
         record_audit_event,
-        args=[event],
+        event,
         start_to_close_timeout=timedelta(seconds=10),
     )
 """
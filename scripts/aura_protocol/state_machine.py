@@ -14,6 +14,7 @@ Key types:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -118,6 +119,15 @@ _REVISE_DRIVES_BACK_PHASES: frozenset[PhaseId] = frozenset(
 )
 
 
+def _validate_axis(axis: ReviewAxis) -> None:
+    """Raise ValueError if axis is not one of the 3 canonical review axes."""
+    if axis not in _REVIEW_AXES:
+        raise ValueError(
+            f"Invalid review axis {axis!r}. Must be one of {sorted(_REVIEW_AXES)}. "
+            f"Use ReviewAxis.Correctness, ReviewAxis.TestQuality, or ReviewAxis.Elegance."
+        )
+
+
 class EpochStateMachine:
     """State machine for the 12-phase epoch lifecycle.
 
@@ -145,6 +155,21 @@ class EpochStateMachine:
             current_phase=PhaseId.P1_Request,
         )
 
+    @classmethod
+    def from_state(
+        cls,
+        state: EpochState,
+        specs: dict[PhaseId, PhaseSpec] | None = None,
+    ) -> EpochStateMachine:
+        """Rebuild a state machine around a previously captured EpochState.
+
+        Used to resume an epoch mid-lifecycle (e.g. after a workflow
+        continue-as-new). The state object is adopted as-is, not copied.
+        """
+        sm = cls(state.epoch_id, specs)
+        sm._state = state
+        return sm
+
     # ── Public Properties ──────────────────────────────────────────────────────
 
     @property
@@ -356,13 +381,26 @@ class EpochStateMachine:
                 Fix: use a ReviewAxis member or a valid string value
                 ("correctness", "test_quality", "elegance").
         """
-        if axis not in _REVIEW_AXES:
-            raise ValueError(
-                f"Invalid review axis {axis!r}. Must be one of {sorted(_REVIEW_AXES)}. "
-                f"Use ReviewAxis.Correctness, ReviewAxis.TestQuality, or ReviewAxis.Elegance."
-            )
+        _validate_axis(axis)
         self._state.review_votes[ReviewAxis(axis)] = vote
 
+    def record_votes(self, votes: Iterable[tuple[ReviewAxis, VoteType]]) -> None:
+        """Record a batch of reviewer votes in order.
+
+        Equivalent to calling record_vote() for each (axis, vote) pair, but the
+        whole batch is validated before any vote is stored: if one axis is
+        invalid, no vote from the batch is recorded. Later votes for the same
+        axis overwrite earlier ones, exactly as with sequential record_vote().
+
+        Raises:
+            ValueError: If any axis is not a valid ReviewAxis value (see
+                record_vote() for the accepted values).
+        """
+        batch = list(votes)
+        for axis, _ in batch:
+            _validate_axis(axis)
+        self._state.review_votes.update((ReviewAxis(axis), vote) for axis, vote in batch)
+
     def has_consensus(self) -> bool:
         """Return True if all 3 review axes (CORRECTNESS, TEST_QUALITY, ELEGANCE) have ACCEPT votes.
 
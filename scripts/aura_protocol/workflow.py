@@ -11,7 +11,7 @@ Design rules:
 - Activities handle non-deterministic operations (constraint checks, recording).
 - One workflow per epoch (not per phase) — sufficient for v1.
 
-Key types (all frozen dataclasses):
+Key types (all frozen, slotted dataclasses):
     EpochInput          — workflow run() input
     EpochResult         — workflow run() return value
     PhaseAdvanceSignal  — advance_phase signal payload
@@ -32,6 +32,7 @@ Search attribute keys:
 Activities:
     check_constraints(state, to_phase) -> list[ConstraintViolation]
     record_transition(record: TransitionRecord) -> None
+    record_transition_batch(records: list[TransitionRecord]) -> None
 
 Child Workflows:
     SliceWorkflow       — single P9_SLICE; runs concurrently with other slices
@@ -42,11 +43,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 
 from temporalio import activity, workflow
-from temporalio.common import SearchAttributeKey
+from temporalio.common import SearchAttributeKey, SearchAttributeUpdate
 
 from aura_protocol.constraints import ConstraintViolation, RuntimeConstraintChecker
 from aura_protocol.state_machine import (
@@ -72,6 +75,8 @@ from aura_protocol.types import (
     VoteType,
 )
 
+logger = logging.getLogger(__name__)
+
 # ─── Search Attribute Keys ────────────────────────────────────────────────────
 # These keys are registered in the Temporal namespace and used for forensic
 # querying: "find all workflows where AuraPhase='p9'" etc.
@@ -83,23 +88,71 @@ SA_STATUS: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraStatus")
 SA_DOMAIN: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraDomain")
 SA_LAST_EVENT_TYPE: SearchAttributeKey = SearchAttributeKey.for_keyword("AuraLastEventType")
 
+# Per-phase search attribute strings, computed once at import:
+# PhaseId → (AuraPhase, AuraStatus, AuraDomain). Phases without a domain
+# (COMPLETE) map to an empty AuraDomain.
+_PHASE_SA_STR: dict[PhaseId, tuple[str, str, str]] = {
+    p: (
+        p.value,
+        "complete" if p is PhaseId.Complete else "running",
+        PHASE_DOMAIN[p].value if p in PHASE_DOMAIN else "",
+    )
+    for p in PhaseId
+}
+
+# RoleId → AuraRole keyword string.
+_ROLE_STR: dict[RoleId, str] = {r: r.value for r in RoleId}
+
+# Pre-built search attribute updates for every value drawn from a closed set
+# (phase, role, status, domain, last event type), keyed by (attribute name,
+# value). Updates are frozen, so one instance is shared by every transition
+# of every workflow run; only free-form values (the epoch ID) are built per call.
+_SA_PREBUILT: dict[tuple[str, str], SearchAttributeUpdate] = {
+    (update.key.name, update.value): update
+    for update in (
+        SA_STATUS.value_set("running"),
+        SA_STATUS.value_set("complete"),
+        *(SA_PHASE.value_set(phase_str) for phase_str, _, _ in _PHASE_SA_STR.values()),
+        *(SA_ROLE.value_set(role_str) for role_str in _ROLE_STR.values()),
+        *(SA_DOMAIN.value_set(domain_str) for _, _, domain_str in _PHASE_SA_STR.values()),
+        *(SA_LAST_EVENT_TYPE.value_set(e.value) for e in EventType),
+    )
+}
+
+# Number of review axes that must vote before ReviewPhaseWorkflow completes.
+_AXIS_COUNT: int = len(ReviewAxis)
+
+# ReviewPhaseWorkflow stores votes in a fixed slot list indexed by axis
+# position; _AXES maps a slot back to its ReviewAxis member.
+_AXES: tuple[ReviewAxis, ...] = tuple(ReviewAxis)
+_AXIS_INDEX: dict[ReviewAxis, int] = {axis: i for i, axis in enumerate(_AXES)}
+
 
 # ─── Signal / Query Types (frozen dataclasses) ────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpochInput:
     """Input for EpochWorkflow.run().
 
     epoch_id: globally unique epoch identifier (e.g. "aura-plugins-bj1")
     request_description: human-readable description of the work request
+    resume: state carried over from a previous run of the same epoch when
+        EpochWorkflow continues-as-new; None for a fresh epoch
+    persist_transitions: run record_transition_batch for each drained batch.
+        Off by default while record_transition is a v1 logging stub — the
+        records are kept in EpochState.transition_history, which is then
+        never trimmed (EpochCheckpoint carries it across continue-as-new).
+        When on, persisted records are trimmed from the checkpoint.
     """
 
     epoch_id: str
     request_description: str
+    resume: EpochCheckpoint | None = None
+    persist_transitions: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpochResult:
     """Return value of EpochWorkflow.run() when the epoch reaches COMPLETE.
 
@@ -122,7 +175,7 @@ class EpochResult:
     constraint_violations_total: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseAdvanceSignal:
     """Signal payload for EpochWorkflow.advance_phase().
 
@@ -136,7 +189,7 @@ class PhaseAdvanceSignal:
     condition_met: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewVoteSignal:
     """Signal payload for EpochWorkflow.submit_vote().
 
@@ -153,10 +206,38 @@ class ReviewVoteSignal:
     reviewer_id: str
 
 
+@dataclass(frozen=True, slots=True)
+class EpochCheckpoint:
+    """State handed from one EpochWorkflow run to the next on continue-as-new.
+
+    state: epoch state at the hand-off. Without persist_transitions the
+        history is the epoch's only audit trail and is carried over in full;
+        with it, records already written by record_transition_batch are
+        trimmed down to the latest one
+    successful_transition_count / failed_transition_count: running counts,
+        so the final EpochResult covers the whole epoch, not just the last run
+    constraint_violations_total: cumulative violations so far
+    pending_advance / pending_votes: signals received but not yet processed;
+        the next run handles them first, in the same order
+    active_sessions: sessions registered via register_session
+
+    The slice progress log is not carried over: it is a real-time view of
+    in-flight slices, and its growth is one of the continue-as-new triggers.
+    """
+
+    state: EpochState
+    successful_transition_count: int
+    failed_transition_count: int
+    constraint_violations_total: int
+    pending_advance: tuple[PhaseAdvanceSignal, ...] = ()
+    pending_votes: tuple[ReviewVoteSignal, ...] = ()
+    active_sessions: tuple[SessionRegisterSignal, ...] = ()
+
+
 # ─── Child Workflow I/O Types (frozen dataclasses) ────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionRegisterSignal:
     """Signal payload for EpochWorkflow.register_session().
 
@@ -175,7 +256,7 @@ class SessionRegisterSignal:
     model: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliceProgressSignal:
     """Signal from SliceWorkflow → EpochWorkflow reporting per-leaf-task progress.
 
@@ -197,7 +278,7 @@ class SliceProgressSignal:
     completed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliceInput:
     """Input for SliceWorkflow.run().
 
@@ -215,7 +296,7 @@ class SliceInput:
     parent_workflow_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliceResult:
     """Return value of SliceWorkflow.run().
 
@@ -231,7 +312,7 @@ class SliceResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewInput:
     """Input for ReviewPhaseWorkflow.run().
 
@@ -243,7 +324,7 @@ class ReviewInput:
     phase_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewPhaseResult:
     """Return value of ReviewPhaseWorkflow.run().
 
@@ -262,7 +343,7 @@ class ReviewPhaseResult:
 # ─── Query Result Types ──────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryStateResult:
     """Frozen DTO returned by EpochWorkflow.full_state() query.
 
@@ -313,10 +394,12 @@ async def record_transition(record: TransitionRecord) -> None:
     This activity exists to:
     1. Enforce the design boundary: recording is non-deterministic (I/O)
     2. Provide an extension point for v2 persistence without changing the workflow
+
+    EpochWorkflow persists records through record_transition_batch, which
+    delegates here once per record.
     """
     # v1 stub: transition is already recorded in EpochState.transition_history.
     # v2: write to beads/database/audit log here.
-    logger = logging.getLogger(__name__)
     logger.info(
         "Transition recorded: %s -> %s (triggered_by=%s)",
         record.from_phase.value,
@@ -325,6 +408,26 @@ async def record_transition(record: TransitionRecord) -> None:
     )
 
 
+@activity.defn
+async def record_transition_batch(records: list[TransitionRecord]) -> None:
+    """Persist a batch of transition records to the audit trail, in order.
+
+    Batched variant of record_transition: EpochWorkflow drains every queued
+    advance signal in one pass and persists the resulting records (failed
+    attempts included) with a single call instead of one activity per
+    transition.
+
+    EpochWorkflow runs it as a local activity (execute_local_activity): it
+    executes on the workflow's own worker, skipping the task-queue round-trip
+    (schedule-to-start latency). The tradeoff: retries are driven by the
+    worker rather than the server, and no heartbeating or long timeouts. It
+    stays registered as a regular @activity.defn, so a v2 durable write that
+    needs those can switch the call site back to execute_activity.
+    """
+    for record in records:
+        await record_transition(record)
+
+
 # ─── Workflow ─────────────────────────────────────────────────────────────────
 
 
@@ -335,10 +438,16 @@ class EpochWorkflow:
     Lifecycle:
         1. run() initializes the state machine and updates search attributes.
         2. run() loops, waiting for advance_phase or submit_vote signals.
-        3. On advance_phase: constraints are checked (activity), then state
-           machine advances, search attributes are updated atomically.
+        3. On advance_phase: queued advances are drained as a batch and their
+           constraints checked concurrently (activities); the state machine
+           then advances once per signal in arrival order. The batch's
+           records are persisted and search attributes updated once per
+           drained batch.
         4. On submit_vote: the vote is recorded in the state machine.
         5. When current_phase reaches COMPLETE, run() returns EpochResult.
+        6. If the run's event history or slice progress log grows past its
+           threshold first, run() continues-as-new with an EpochCheckpoint
+           and the next run resumes from it.
 
     Signals:
         advance_phase(PhaseAdvanceSignal)       — request a phase transition
@@ -347,23 +456,59 @@ class EpochWorkflow:
 
     Queries:
         current_state() -> EpochState           — snapshot of epoch runtime state
-        available_transitions() -> list[Transition] — valid next transitions
+        available_transitions() -> Sequence[Transition] — valid next transitions
         slice_progress_state() -> list[SliceProgressSignal] — accumulated slice progress log
 
     Design invariants:
         - No datetime.now() in workflow code (use workflow.now() instead)
         - No I/O in workflow code (all I/O goes through activities)
         - Signal handlers enqueue work; transitions happen in run() loop
-        - Search attributes updated via upsert_search_attributes() on every
-          transition to keep AuraPhase / AuraStatus always in sync
+        - Search attributes updated via upsert_search_attributes() after
+          every drained batch of transitions to keep AuraPhase / AuraStatus
+          in sync; only attributes whose value changed are sent
     """
 
+    # Continue-as-new thresholds: event history length of the current run,
+    # and number of buffered slice progress signals. Both well under
+    # Temporal's hard history limits (50k events / 50MB).
+    _CAN_THRESHOLD_EVENTS: int = 10_000
+    _CAN_THRESHOLD_LOG_LEN: int = 5_000
+
+    # Fixed attribute layout: no per-instance __dict__, and signal handlers
+    # reach their queues through slot descriptors.
+    __slots__ = (
+        "_pending_advance",
+        "_pending_votes",
+        "_checked_advances",
+        "_total_violations",
+        "_successful_count",
+        "_failed_count",
+        "_sm",
+        "_slice_progress_log",
+        "_active_sessions",
+        "_sa_cache",
+        "_state_version",
+        "_avail_cache",
+    )
+
     def __init__(self) -> None:
         # Pending signals are queued here and processed in the run() loop.
-        self._pending_advance: list[PhaseAdvanceSignal] = []
-        self._pending_votes: list[ReviewVoteSignal] = []
+        # deque: FIFO drain via popleft() is O(1), unlike list.pop(0).
+        self._pending_advance: deque[PhaseAdvanceSignal] = deque()
+        self._pending_votes: deque[ReviewVoteSignal] = deque()
+        # Advances whose check_constraints activity is already in flight,
+        # awaiting their turn to be applied (arrival order).
+        # The handle is None for no-op (self-transition) advances, which are
+        # applied (and fail) without a check.
+        self._checked_advances: deque[
+            tuple[PhaseAdvanceSignal, workflow.ActivityHandle[list[ConstraintViolation]] | None]
+        ] = deque()
         # Cumulative violation count across all transitions.
         self._total_violations: int = 0
+        # Running transition counts — mirror transition_history so EpochResult
+        # needs no scan of the history at completion.
+        self._successful_count: int = 0
+        self._failed_count: int = 0
         # State machine — initialized in run().
         self._sm: EpochStateMachine | None = None
         # Slice progress log — appended by slice_progress signal handler.
@@ -371,6 +516,13 @@ class EpochWorkflow:
         self._slice_progress_log: list[SliceProgressSignal] = []
         # Active sessions — registered via register_session signal (SLICE-7).
         self._active_sessions: list[SessionRegisterSignal] = []
+        # Last upserted search attribute values, keyed by attribute name.
+        self._sa_cache: dict[str, str] = {}
+        # available_transitions memo: (state version, transitions). The
+        # version is bumped whenever run() mutates the state machine (vote
+        # drain, successful or failed advance), invalidating the memo.
+        self._state_version: int = 0
+        self._avail_cache: tuple[int, tuple[Transition, ...]] | None = None
 
     # ── Run ───────────────────────────────────────────────────────────────────
 
@@ -380,15 +532,31 @@ class EpochWorkflow:
 
         Starts at P1_REQUEST and runs until COMPLETE. On each iteration:
         1. Drain any pending vote signals into the state machine.
-        2. Process the next pending advance signal (if any):
-           a. Check constraints via activity.
-           b. Advance state machine.
-           c. Persist transition record via activity.
-           d. Upsert search attributes.
-        3. Wait for the next signal (or exit if COMPLETE).
+        2. Drain all pending advance signals and start their constraint checks
+           concurrently (one activity per signal, all scheduled against the
+           same pre-apply state snapshot).
+        3. Apply each advance in arrival order, without waiting for its check
+           (violations are counted, never gating):
+           a. Drain votes that arrived since the last drain.
+           b. Advance state machine (re-validates against live state).
+           c. Record the audit event via activity.
+           d. Await the check and add its violations to the running total.
+           e. Start checks for advances that arrived meanwhile (pipelining).
+        4. Once the queue is drained, persist the batch's transition records
+           with one local activity and upsert search attributes once. The
+           record overlaps with the next batch's constraint checks and is
+           awaited before the following record (or at completion).
+        5. Wait for the next signal (or exit if COMPLETE).
         """
-        # Initialize the state machine.
-        self._sm = EpochStateMachine(input.epoch_id)
+        # Initialize the state machine, or resume it after continue-as-new.
+        if input.resume is not None:
+            self._restore_checkpoint(input.resume)
+        else:
+            self._sm = EpochStateMachine(input.epoch_id)
+        # Loop-invariant references bound once: the state machine mutates its
+        # EpochState in place, so `state` always reflects the live phase.
+        state = self._sm.state
+        checked_advances = self._checked_advances
 
         # Set initial search attributes.
         # SA_EPOCH_ID is immutable for the lifetime of this workflow run — it
@@ -396,119 +564,338 @@ class EpochWorkflow:
         # intentionally omitted from per-transition upserts below. Temporal
         # preserves existing search attribute values across upserts, so the
         # epoch ID remains indexed for forensic lookup throughout the run.
-        initial_phase = self._sm.state.current_phase
-        initial_domain = PHASE_DOMAIN[initial_phase].value if initial_phase in PHASE_DOMAIN else ""
-        workflow.upsert_search_attributes(
-            [
-                SA_EPOCH_ID.value_set(input.epoch_id),
-                SA_PHASE.value_set(initial_phase.value),
-                SA_ROLE.value_set(self._sm.state.current_role.value),
-                SA_STATUS.value_set("running"),
-                SA_DOMAIN.value_set(initial_domain),
-            ]
+        phase_str, _, domain_str = _PHASE_SA_STR[state.current_phase]
+        self._upsert_changed_search_attributes(
+            {
+                SA_EPOCH_ID: input.epoch_id,
+                SA_PHASE: phase_str,
+                SA_ROLE: _ROLE_STR[state.current_role],
+                SA_STATUS: "running",
+                SA_DOMAIN: domain_str,
+            }
         )
 
         # Main signal-driven loop.
-        while self._sm.state.current_phase != PhaseId.Complete:
+        record_in_flight: workflow.ActivityHandle[None] | None = None
+        # Phases are compared by identity: the payload converter always
+        # decodes signal phases to PhaseId members, never to raw strings.
+        while state.current_phase is not PhaseId.Complete:
+            # Hand off to a fresh run before history hits Temporal's limits.
+            # The in-flight record is awaited first so no batch is lost.
+            if self._should_continue_as_new():
+                if record_in_flight is not None:
+                    await record_in_flight
+                workflow.continue_as_new(
+                    replace(
+                        input,
+                        resume=self._checkpoint(trim_persisted=input.persist_transitions),
+                    )
+                )
+
             # Wait until there is something to process.
-            await workflow.wait_condition(
-                lambda: bool(self._pending_advance) or bool(self._pending_votes)
-            )
+            await workflow.wait_condition(self._has_work)
 
             # 1. Drain all pending votes.
-            while self._pending_votes:
-                vote_signal = self._pending_votes.pop(0)
-                self._sm.record_vote(vote_signal.axis, vote_signal.vote)
+            self._drain_votes()
+
+            # 2. Move every queued advance into the checked queue, with its
+            # check_constraints activity already in flight. Checks for the whole
+            # batch run concurrently and are all scheduled (state serialized)
+            # before any advance below is applied.
+            self._prefetch_constraint_checks()
+
+            # 3. Apply advances one-by-one in deterministic (arrival) order.
+            # Every record they append to transition_history (failed attempts
+            # included) goes out in one batched write below.
+            batch_start = len(state.transition_history)
+            while checked_advances:
+                if state.current_phase is PhaseId.Complete:
+                    # Epoch finished mid-batch — remaining signals are moot,
+                    # but their checks are already in flight: cancel them so
+                    # none is left running when run() returns.
+                    await self._cancel_checked_advances()
+                    break
+                advance_signal, check = checked_advances.popleft()
+                if check is None and advance_signal.to_phase is not state.current_phase:
+                    # Prefetch projected a self-transition, but an earlier
+                    # advance in the batch failed: this one is real.
+                    check = self._start_constraint_check(advance_signal.to_phase)
+
+                # 3a. Votes may have arrived since the last drain.
+                self._drain_votes()
+
+                # 3b. Apply without waiting on the check: violations are only
+                # counted, never gate the advance (_sm.advance() validates on
+                # its own), so the advance goes out while the check is still
+                # running.
+                await self._apply_advance(input.epoch_id, advance_signal)
+                if check is not None:
+                    self._total_violations += len(await check)
+
+                # 3c. Pipeline: advances that arrived while this one was being
+                # applied get their checks in flight now, overlapping with the
+                # remaining applies instead of waiting for the next iteration.
+                self._prefetch_constraint_checks()
+
+            # 4. Coalesce the drained batch: one record activity and one
+            # search-attribute upsert reflecting the final phase, rather than
+            # one of each per transition. Failed advances leave the search
+            # attributes unchanged (so the upsert sends nothing for them).
+            # The record is not awaited here: it stays in flight while the
+            # loop moves on to the next batch's constraint checks, and is
+            # awaited before the next record starts (keeping records ordered)
+            # or once the epoch completes.
+            # record_transition is a v1 logging stub (records already live in
+            # transition_history), so it only runs when the epoch opts in.
+            # Without it, transition_history stays the audit trail of record
+            # and _checkpoint() carries it in full; with it, records already
+            # written are trimmed from the checkpoint.
+            batch_records = state.transition_history[batch_start:]
+            if batch_records:
+                if input.persist_transitions:
+                    if record_in_flight is not None:
+                        await record_in_flight
+                    record_in_flight = workflow.start_local_activity(
+                        record_transition_batch,
+                        batch_records,
+                        start_to_close_timeout=timedelta(seconds=5),
+                    )
+                self._upsert_phase_search_attributes()
+
+        if record_in_flight is not None:
+            await record_in_flight
+
+        return EpochResult(
+            epoch_id=input.epoch_id,
+            final_phase=state.current_phase,
+            transition_count=self._successful_count + self._failed_count,
+            successful_transition_count=self._successful_count,
+            constraint_violations_total=self._total_violations,
+        )
 
-            # 2. Process the next advance signal.
-            if not self._pending_advance:
+    # ── Run helpers ───────────────────────────────────────────────────────────
+
+    def _prefetch_constraint_checks(self) -> None:
+        """Start check_constraints for every queued advance signal.
+
+        Each signal moves from _pending_advance to _checked_advances together
+        with its in-flight check, preserving arrival order. The check gets a
+        detached snapshot of the state (_state_snapshot()), not the live
+        EpochState: temporalio re-serializes local activity arguments on
+        every retry, so a live reference would let a retried check see
+        advances applied after scheduling. A stale result is acceptable
+        because _sm.advance() re-validates against live state.
+
+        Self-transitions get no check: never in the transition table, so
+        _sm.advance() records them as failed attempts, and check_transition()
+        has no rule for them. They are detected against the projected phase —
+        the target of the last queued advance, or the live phase when none is
+        queued — since that is the phase the signal will be applied to. If
+        the projection turns out wrong (an earlier advance failed), run()
+        starts the missing check at apply time.
+        """
+        checked = self._checked_advances
+        while self._pending_advance:
+            advance_signal = self._pending_advance.popleft()
+            projected = checked[-1][0].to_phase if checked else self._sm.state.current_phase
+            if advance_signal.to_phase is projected:
+                checked.append((advance_signal, None))
                 continue
+            checked.append((advance_signal, self._start_constraint_check(advance_signal.to_phase)))
+
+    def _start_constraint_check(
+        self, to_phase: PhaseId
+    ) -> workflow.ActivityHandle[list[ConstraintViolation]]:
+        """Start check_constraints for to_phase against a snapshot of the current state."""
+        return workflow.start_local_activity(
+            check_constraints,
+            args=(self._state_snapshot(), to_phase),
+            start_to_close_timeout=timedelta(seconds=10),
+        )
 
-            advance_signal = self._pending_advance.pop(0)
+    async def _cancel_checked_advances(self) -> None:
+        """Drop every advance still in _checked_advances, cancelling its check.
 
-            # 2a. Check constraints (activity — non-deterministic allowed here).
-            violations = await workflow.execute_activity(
-                check_constraints,
-                args=[self._sm.state, advance_signal.to_phase],
-                start_to_close_timeout=timedelta(seconds=10),
-            )
-            self._total_violations += len(violations)
+        Waits for the cancelled checks to settle; their results (or
+        cancellation errors) are discarded.
+        """
+        checks = [check for _, check in self._checked_advances if check is not None]
+        self._checked_advances.clear()
+        for check in checks:
+            check.cancel()
+        await asyncio.gather(*checks, return_exceptions=True)
+
+    def _state_snapshot(self) -> EpochState:
+        """Return a detached copy of the state machine's EpochState.
+
+        Every mutable container is copied, so later mutations of the live
+        state cannot reach the copy (and vice versa). The records inside
+        transition_history are frozen and shared, not copied.
+        """
+        state = self._sm.state
+        return replace(
+            state,
+            completed_phases=set(state.completed_phases),
+            review_votes=dict(state.review_votes),
+            severity_groups={level: set(ids) for level, ids in state.severity_groups.items()},
+            transition_history=list(state.transition_history),
+        )
 
-            # 2b. Advance state machine (pure, deterministic).
-            # Pass timestamp=workflow.now() directly so the record uses
-            # deterministic workflow time — no post-hoc mutation needed.
-            try:
-                record = self._sm.advance(
-                    advance_signal.to_phase,
-                    triggered_by=advance_signal.triggered_by,
-                    condition_met=advance_signal.condition_met,
-                    timestamp=workflow.now(),
-                )
-            except TransitionError as e:
-                # Invalid advance — record the failed attempt in the audit trail
-                # so the transition_history captures all attempts (not just successes).
-                # The failed record uses condition_met="FAILED: {error}" for display
-                # and success=False for all programmatic success/failure checks.
-                failed_record = TransitionRecord(
-                    from_phase=self._sm.state.current_phase,
-                    to_phase=advance_signal.to_phase,
-                    timestamp=workflow.now(),
-                    triggered_by=advance_signal.triggered_by,
-                    condition_met=f"FAILED: {e}",
-                    success=False,
-                )
-                self._sm.state.transition_history.append(failed_record)
-                self._sm.state.last_error = str(e)
-                continue
+    def _should_continue_as_new(self) -> bool:
+        """True once this run's history or slice progress log is too large."""
+        return (
+            workflow.info().get_current_history_length() > self._CAN_THRESHOLD_EVENTS
+            or len(self._slice_progress_log) > self._CAN_THRESHOLD_LOG_LEN
+        )
 
-            # 2c. Record transition (activity — I/O boundary).
-            await workflow.execute_activity(
-                record_transition,
-                args=[record],
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+    def _checkpoint(self, *, trim_persisted: bool = False) -> EpochCheckpoint:
+        """Capture the state the next run needs to resume this epoch.
 
-            # 2d. Record audit event (activity — I/O boundary).
-            await workflow.execute_activity(
-                "record_audit_event",
-                AuditEvent(
-                    epoch_id=input.epoch_id,
-                    event_type=EventType.PhaseTransition,
-                    phase=record.to_phase,
-                    role=self._sm.state.current_role,
-                    payload={"from": record.from_phase.value, "to": record.to_phase.value},
-                ),
-                start_to_close_timeout=timedelta(seconds=10),
-            )
+        Only called between batches, so _checked_advances is empty; signals
+        still queued are carried over rather than dropped.
 
-            # 2e. Upsert search attributes atomically with the transition.
-            current = self._sm.state.current_phase
-            domain_value = (
-                PHASE_DOMAIN[current].value
-                if current in PHASE_DOMAIN
-                else ""
+        trim_persisted: every record in transition_history has already been
+        written by record_transition_batch (persist_transitions is on and the
+        last record was awaited), so only the latest record is carried over —
+        enough for check_audit_trail to see a non-empty trail past P1 — and
+        the checkpoint stays bounded across continue-as-new generations.
+        Without it the full history is carried, as it is the only audit trail.
+        """
+        state = self._state_snapshot()
+        if trim_persisted:
+            state.transition_history = state.transition_history[-1:]
+        return EpochCheckpoint(
+            state=state,
+            successful_transition_count=self._successful_count,
+            failed_transition_count=self._failed_count,
+            constraint_violations_total=self._total_violations,
+            pending_advance=tuple(self._pending_advance),
+            pending_votes=tuple(self._pending_votes),
+            active_sessions=tuple(self._active_sessions),
+        )
+
+    def _restore_checkpoint(self, checkpoint: EpochCheckpoint) -> None:
+        """Resume from a checkpoint written by a previous run's _checkpoint()."""
+        self._sm = EpochStateMachine.from_state(checkpoint.state)
+        self._successful_count = checkpoint.successful_transition_count
+        self._failed_count = checkpoint.failed_transition_count
+        self._total_violations = checkpoint.constraint_violations_total
+        # Carried-over signals go ahead of any that arrived before run() started.
+        self._pending_advance.extendleft(reversed(checkpoint.pending_advance))
+        self._pending_votes.extendleft(reversed(checkpoint.pending_votes))
+        sessions = list(checkpoint.active_sessions)
+        known = {session.session_id for session in sessions}
+        sessions.extend(s for s in self._active_sessions if s.session_id not in known)
+        self._active_sessions = sessions
+
+    def _has_work(self) -> bool:
+        """wait_condition predicate: True when an advance or vote is queued."""
+        return bool(self._pending_advance) or bool(self._pending_votes)
+
+    def _drain_votes(self) -> None:
+        """Apply all queued vote signals to the state machine in arrival order.
+
+        The queue is snapshotted and cleared, then handed to the state machine
+        as a single record_votes() batch rather than one call per signal.
+        """
+        if not self._pending_votes:
+            return
+        batch = list(self._pending_votes)
+        self._pending_votes.clear()
+        self._sm.record_votes((v.axis, v.vote) for v in batch)
+        self._state_version += 1
+
+    async def _apply_advance(
+        self, epoch_id: str, advance_signal: PhaseAdvanceSignal
+    ) -> TransitionRecord | None:
+        """Advance the state machine for one signal and record its audit event.
+
+        Returns the TransitionRecord for the caller to persist with the rest
+        of its batch. A rejected advance is appended to transition_history as
+        a failed record (success=False), surfaced via last_error, and returns
+        None without running any activity.
+        """
+        # Advance state machine (pure, deterministic).
+        # Pass timestamp=workflow.now() directly so the record uses
+        # deterministic workflow time — no post-hoc mutation needed.
+        try:
+            record = self._sm.advance(
+                advance_signal.to_phase,
+                triggered_by=advance_signal.triggered_by,
+                condition_met=advance_signal.condition_met,
+                timestamp=workflow.now(),
             )
-            workflow.upsert_search_attributes(
-                [
-                    SA_PHASE.value_set(current.value),
-                    SA_ROLE.value_set(self._sm.state.current_role.value),
-                    SA_STATUS.value_set(
-                        "complete" if current == PhaseId.Complete else "running"
-                    ),
-                    SA_DOMAIN.value_set(domain_value),
-                    SA_LAST_EVENT_TYPE.value_set(EventType.PhaseTransition.value),
-                ]
+        except TransitionError as e:
+            # Invalid advance — record the failed attempt in the audit trail
+            # so the transition_history captures all attempts (not just successes).
+            # The failed record uses condition_met="FAILED: {error}" for display
+            # and success=False for all programmatic success/failure checks.
+            failed_record = TransitionRecord(
+                from_phase=self._sm.state.current_phase,
+                to_phase=advance_signal.to_phase,
+                timestamp=workflow.now(),
+                triggered_by=advance_signal.triggered_by,
+                condition_met=f"FAILED: {e}",
+                success=False,
             )
+            self._sm.state.transition_history.append(failed_record)
+            self._sm.state.last_error = str(e)
+            self._failed_count += 1
+            self._state_version += 1
+            return None
+
+        self._successful_count += 1
+        self._state_version += 1
+
+        # Record audit event (activity — I/O boundary).
+        await workflow.execute_activity(
+            "record_audit_event",
+            AuditEvent(
+                epoch_id=epoch_id,
+                event_type=EventType.PhaseTransition,
+                phase=record.to_phase,
+                role=self._sm.state.current_role,
+                payload={"from": record.from_phase.value, "to": record.to_phase.value},
+            ),
+            start_to_close_timeout=timedelta(seconds=10),
+        )
+        return record
+
+    def _upsert_phase_search_attributes(self) -> None:
+        """Upsert search attributes to reflect the current phase and role."""
+        phase_str, status_str, domain_str = _PHASE_SA_STR[self._sm.state.current_phase]
+        self._upsert_changed_search_attributes(
+            {
+                SA_PHASE: phase_str,
+                SA_ROLE: _ROLE_STR[self._sm.state.current_role],
+                SA_STATUS: status_str,
+                SA_DOMAIN: domain_str,
+                SA_LAST_EVENT_TYPE: EventType.PhaseTransition.value,
+            }
+        )
 
-        history = self._sm.state.transition_history
-        successful = sum(1 for r in history if r.success)
-        return EpochResult(
-            epoch_id=input.epoch_id,
-            final_phase=self._sm.state.current_phase,
-            transition_count=len(history),
-            successful_transition_count=successful,
-            constraint_violations_total=self._total_violations,
+    def _upsert_changed_search_attributes(self, values: dict[SearchAttributeKey, str]) -> None:
+        """Upsert only the search attributes whose value differs from the last upsert.
+
+        Each upsert is a command in workflow history, so unchanged values (e.g.
+        AuraRole across most transitions) are not re-sent. Temporal preserves
+        omitted attributes, and _sa_cache is rebuilt deterministically on replay
+        from the same event sequence. No command is emitted when nothing changed.
+        """
+        changed = {
+            key: value
+            for key, value in values.items()
+            if self._sa_cache.get(key.name) != value
+        }
+        if not changed:
+            return
+        workflow.upsert_search_attributes(
+            [
+                _SA_PREBUILT.get((key.name, value)) or key.value_set(value)
+                for key, value in changed.items()
+            ]
         )
+        self._sa_cache.update((key.name, value) for key, value in changed.items())
 
     # ── Signals ───────────────────────────────────────────────────────────────
 
@@ -561,24 +948,28 @@ class EpochWorkflow:
     def current_state(self) -> EpochState:
         """Query: return a snapshot of the current epoch runtime state.
 
-        Returns the EpochState from the underlying state machine.
-        The returned state is mutable — callers must not modify it.
+        Returns a detached copy (_state_snapshot()), so mutating the result
+        cannot reach the live state held in the (sticky-cached) workflow
+        instance.
         """
         if self._sm is None:
             # Workflow not yet initialized (query before run() starts).
             raise RuntimeError("Workflow not yet initialized — run() has not started.")
-        return self._sm.state
+        return self._state_snapshot()
 
     @workflow.query
-    def available_transitions(self) -> list[Transition]:
+    def available_transitions(self) -> Sequence[Transition]:
         """Query: return the list of currently available phase transitions.
 
         Delegates to EpochStateMachine.available_transitions which applies
-        all gate rules (consensus, BLOCKER, REVISE vote).
+        all gate rules (consensus, BLOCKER, REVISE vote). The result is
+        memoized as an immutable tuple until run() next mutates the state
+        machine, so repeated queries between transitions neither re-evaluate
+        the gates nor allocate a new list.
         """
         if self._sm is None:
-            return []
-        return self._sm.available_transitions
+            return ()
+        return self._cached_available_transitions()
 
     @workflow.query
     def full_state(self) -> "QueryStateResult":
@@ -596,7 +987,7 @@ class EpochWorkflow:
             transition_history=list(state.transition_history),
             votes=dict(state.review_votes),
             last_error=state.last_error,
-            available_transitions=list(self._sm.available_transitions),
+            available_transitions=list(self._cached_available_transitions()),
             active_session_count=len(self._active_sessions),
         )
 
@@ -621,12 +1012,20 @@ class EpochWorkflow:
         """
         return list(self._active_sessions)
 
+    def _cached_available_transitions(self) -> tuple[Transition, ...]:
+        """Return available_transitions, recomputing only after a state change."""
+        if self._avail_cache is not None and self._avail_cache[0] == self._state_version:
+            return self._avail_cache[1]
+        transitions = tuple(self._sm.available_transitions)
+        self._avail_cache = (self._state_version, transitions)
+        return transitions
+
     # ── P9 Slice Execution ────────────────────────────────────────────────────
 
     async def _run_p9_slices(self, slice_inputs: list[SliceInput]) -> list[SliceResult]:
         """Run P9_SLICE: start N child SliceWorkflows, fail-fast on first exception.
 
-        Starts all SliceWorkflow children concurrently, then waits for them
+        Issues all SliceWorkflow child starts in one batch, then waits for them
         using workflow.wait(FIRST_EXCEPTION) — the deterministic Temporal
         equivalent of asyncio.wait. On the first failure, cancels all
         pending handles and propagates the exception.
@@ -640,19 +1039,37 @@ class EpochWorkflow:
         Raises:
             Exception: The first exception raised by any failing slice.
         """
-        # Start all child SliceWorkflows concurrently.
-        handles = []
-        for si in slice_inputs:
-            handle = await workflow.start_child_workflow(
-                SliceWorkflow.run,
-                si,
-                id=f"{si.epoch_id}-slice-{si.slice_id}",
-            )
-            handles.append(handle)
-
-        if not handles:
+        if not slice_inputs:
             return []
 
+        # Child IDs are "{epoch_id}-slice-{slice_id}". Sibling slices share
+        # the parent's epoch_id, so the prefix is formatted once; a slice with
+        # a different epoch_id falls back to the full format.
+        epoch_id = slice_inputs[0].epoch_id
+        id_prefix = f"{epoch_id}-slice-"
+
+        # Start all child SliceWorkflows concurrently. Every start is scheduled
+        # as a task before any is awaited, so all StartChildWorkflowExecution
+        # commands go out in one workflow task (one round-trip, not N). Handles
+        # are read back from start_tasks (input order), never from the done
+        # set, to keep ordering deterministic.
+        start_tasks = [
+            asyncio.ensure_future(
+                workflow.start_child_workflow(
+                    SliceWorkflow.run,
+                    si,
+                    id=(
+                        id_prefix + si.slice_id
+                        if si.epoch_id == epoch_id
+                        else f"{si.epoch_id}-slice-{si.slice_id}"
+                    ),
+                )
+            )
+            for si in slice_inputs
+        ]
+        await workflow.wait(start_tasks, return_when=asyncio.ALL_COMPLETED)
+        handles = [t.result() for t in start_tasks]
+
         # Collect result futures from handles. ChildWorkflowHandle IS an
         # asyncio.Task in the Temporal Python SDK, so await it to get the result.
         # Use workflow.wait(FIRST_EXCEPTION) for deterministic fail-fast semantics.
@@ -663,18 +1080,20 @@ class EpochWorkflow:
             return_when=asyncio.FIRST_EXCEPTION,
         )
 
-        # Cancel remaining pending handles on failure.
-        # Awaiting each cancelled handle individually (not asyncio.gather)
-        # ensures no parallel fan-out from the supervisor — each cancellation
-        # is explicitly drained in sequence.
+        # Cancel remaining pending handles on failure, then drain them with a
+        # single workflow.wait(ALL_COMPLETED) instead of awaiting each handle in
+        # turn. Handles are walked in start order (not set order) so the cancel
+        # commands are emitted deterministically. Reading each outcome marks the
+        # exception as retrieved; CancelledError and child failures are expected
+        # here and discarded.
         if pending:
-            for p in pending:
+            cancelled = [h for h in handles if h in pending]
+            for p in cancelled:
                 p.cancel()
-            for p in pending:
-                try:
-                    await p
-                except (asyncio.CancelledError, Exception):
-                    pass
+            await workflow.wait(cancelled, return_when=asyncio.ALL_COMPLETED)
+            for p in cancelled:
+                if not p.cancelled():
+                    p.exception()
 
         # Collect results or re-raise first exception.
         results = []
@@ -795,7 +1214,7 @@ class SliceWorkflow:
             timeout = config.timeout_seconds if config else 300
             result = await workflow.execute_activity(
                 "execute_slice_command",
-                args=[config.command, input.slice_id, input.epoch_id],
+                args=(config.command, input.slice_id, input.epoch_id),
                 start_to_close_timeout=timedelta(seconds=timeout),
                 result_type=SliceResult,
             )
@@ -833,27 +1252,31 @@ class SliceWorkflow:
                 error=cs.error or None,
             )
 
-        # Signal parent EpochWorkflow with completion progress.
-        # Uses input.parent_workflow_id (explicit) for testability.
+        # Signal parent EpochWorkflow with completion progress — one signal per
+        # slice, sent at completion, to keep the parent's signal rate low.
+        # Uses input.parent_workflow_id (explicit) for testability; standalone
+        # slices (empty parent ID) have no parent to signal and skip the
+        # external round-trip entirely.
         # Wrapped in try/except: signal delivery failure must never fail the slice.
-        try:
-            parent_handle = workflow.get_external_workflow_handle(input.parent_workflow_id)
-            await parent_handle.signal(
-                EpochWorkflow.slice_progress,
-                SliceProgressSignal(
-                    slice_id=input.slice_id,
-                    leaf_task_id=input.slice_id,
-                    stage_name="execute",
-                    completed=result.success,
-                ),
-            )
-        except Exception as e:  # noqa: BLE001
-            workflow.logger.warning(
-                "SliceWorkflow(%s): parent signal delivery failed (parent_id=%s): %s",
-                input.slice_id,
-                input.parent_workflow_id,
-                e,
-            )
+        if input.parent_workflow_id:
+            try:
+                parent_handle = workflow.get_external_workflow_handle(input.parent_workflow_id)
+                await parent_handle.signal(
+                    EpochWorkflow.slice_progress,
+                    SliceProgressSignal(
+                        slice_id=input.slice_id,
+                        leaf_task_id=input.slice_id,
+                        stage_name="execute",
+                        completed=result.success,
+                    ),
+                )
+            except Exception as e:  # noqa: BLE001
+                workflow.logger.warning(
+                    "SliceWorkflow(%s): parent signal delivery failed (parent_id=%s): %s",
+                    input.slice_id,
+                    input.parent_workflow_id,
+                    e,
+                )
 
         return result
 
@@ -873,11 +1296,13 @@ class ReviewPhaseWorkflow:
         is dropped rather than causing an error in the parent.
     """
 
+    __slots__ = ("_votes",)
+
     def __init__(self) -> None:
-        # Votes keyed by ReviewAxis StrEnum for type safety.
-        # ReviewAxis is a StrEnum, so its members are also valid str keys and
-        # are safely round-tripped by Temporal's JSONPlainPayloadConverter.
-        self._votes: dict[ReviewAxis, VoteType] = {}
+        # One vote slot per ReviewAxis, indexed via _AXIS_INDEX (None = not
+        # yet voted). The ReviewAxis-keyed mapping is built once at completion
+        # by _vote_result().
+        self._votes: list[VoteType | None] = [None] * _AXIS_COUNT
 
     @workflow.signal
     async def submit_vote(self, signal: ReviewVoteSignal) -> None:
@@ -889,7 +1314,7 @@ class ReviewPhaseWorkflow:
         Args:
             signal: ReviewVoteSignal with axis, vote, and reviewer_id.
         """
-        self._votes[signal.axis] = signal.vote
+        self._votes[_AXIS_INDEX[signal.axis]] = signal.vote
 
     @workflow.run
     async def run(self, input: ReviewInput) -> ReviewPhaseResult:
@@ -905,13 +1330,25 @@ class ReviewPhaseWorkflow:
         Returns:
             ReviewPhaseResult with success=True and the complete vote mapping.
         """
-        # Wait until all 3 ReviewAxis members have voted.
-        all_axes = set(ReviewAxis)
-        await workflow.wait_condition(
-            lambda: set(self._votes.keys()) >= all_axes
-        )
+        # Wait until all 3 ReviewAxis members have voted: every slot filled.
+        # A repeat vote overwrites its axis slot, so this is a 3-slot scan with
+        # no per-signal allocation.
+        await workflow.wait_condition(self._all_voted)
         return ReviewPhaseResult(
             phase_id=input.phase_id,
             success=True,
-            vote_result=dict(self._votes),
+            vote_result=self._vote_result(),
         )
+
+    def _all_voted(self) -> bool:
+        """wait_condition predicate: True once every ReviewAxis slot has a vote."""
+        return None not in self._votes
+
+    def _vote_result(self) -> dict[ReviewAxis, VoteType]:
+        """Return the recorded votes as a ReviewAxis → VoteType mapping.
+
+        Axes without a vote are omitted.
+        """
+        return {
+            _AXES[i]: vote for i, vote in enumerate(self._votes) if vote is not None
+        }
@@ -2,7 +2,8 @@
 """Import issues.jsonl into the Dolt backend via direct MySQL connection.
 
 Reads each JSONL line and inserts into: issues, labels, dependencies, comments.
-Then runs `bd dolt commit` to persist the Dolt history.
+Then calls DOLT_COMMIT on the same connection to persist the Dolt history
+(falling back to `bd dolt commit` if the procedure call fails).
 
 Usage:
     python3 scripts/import_jsonl_to_dolt.py [--dry-run] [--jsonl PATH]
@@ -12,10 +13,30 @@ import argparse
 import json
 import subprocess
 import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import pymysql
 
+# orjson is an optional speedup for parsing large JSONL files; the stdlib json
+# fallback produces the same values (and the same compact metadata text).
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: object) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 BEADS_DIR = Path(__file__).resolve().parent.parent / ".beads"
 DEFAULT_JSONL = BEADS_DIR / "issues.jsonl"
 
@@ -24,63 +45,126 @@ DOLT_PORT = 3307
 DOLT_USER = "root"
 DOLT_DB = "beads_aura-plugins"
 
+# Rows per multi-row INSERT: amortizes round-trips while keeping each
+# statement well under the server's max_allowed_packet.
+BATCH_SIZE = 1000
+
+# Progress is reported every PROGRESS_EVERY issues, or at least once a second.
+PROGRESS_EVERY = 500
+
+# Bytes read from issues.jsonl per chunk.
+READ_CHUNK_SIZE = 1 << 20
+
+# Serialized form of empty dependency metadata.
+_EMPTY_META = "{}"
+
+# Server error codes meaning "LOAD DATA LOCAL is not allowed here":
+# ER_NOT_ALLOWED_COMMAND, MySQL's ER_CLIENT_LOCAL_FILES_DISABLED, and
+# MariaDB's ER_LOAD_INFILE_CAPABILITY_DISABLED.
+_LOAD_DATA_REFUSED_CODES = frozenset({1148, 3948, 4166})
+
+# Statements that undo the SET ...=0 that load_issues runs before loading.
+_RESTORE_CHECKS = ("SET FOREIGN_KEY_CHECKS=1", "SET UNIQUE_CHECKS=1")
+
+
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build a single-VALUES INSERT that executemany can rewrite as multi-row."""
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+# Target columns, in the order issue_rows() emits them.
+ISSUE_COLUMNS = (
+    "id", "title", "description", "design", "acceptance_criteria", "notes",
+    "status", "priority", "issue_type", "owner", "assignee",
+    "created_at", "created_by", "updated_at", "closed_at", "close_reason",
+)
+LABEL_COLUMNS = ("issue_id", "label")
+DEPENDENCY_COLUMNS = (
+    "issue_id", "depends_on_id", "type", "created_at", "created_by", "metadata",
+)
+COMMENT_COLUMNS = ("id", "issue_id", "author", "text", "created_at")
+
+ISSUES_SQL = _insert_sql("issues", ISSUE_COLUMNS)
+LABELS_SQL = _insert_sql("labels", LABEL_COLUMNS)
+DEPENDENCIES_SQL = _insert_sql("dependencies", DEPENDENCY_COLUMNS)
+COMMENTS_SQL = _insert_sql("comments", COMMENT_COLUMNS)
+
+# Load plan, in issue_rows() output order:
+# (table, INSERT statement, issue ID column, LOAD DATA columns or None).
+TABLES: tuple[tuple[str, str, int, tuple[str, ...] | None], ...] = (
+    ("issues", ISSUES_SQL, 0, ISSUE_COLUMNS),
+    ("labels", LABELS_SQL, 0, None),
+    ("dependencies", DEPENDENCIES_SQL, 0, None),
+    ("comments", COMMENTS_SQL, 1, COMMENT_COLUMNS),
+)
+
+
+# Shared connection, reused across connect() calls within one process.
+_conn: pymysql.Connection | None = None
+
 
 def connect() -> pymysql.Connection:
-    return pymysql.connect(
+    """Return the shared Dolt connection, opening it on first use.
+
+    Callers that import this module to load several shards (connect() +
+    load_issues() per shard) reuse one socket instead of paying the TCP and
+    auth handshake each time. A connection the server dropped is revived by
+    ping(); one closed by the caller is replaced.
+    """
+    global _conn
+    if _conn is not None and _conn.open:
+        _conn.ping(reconnect=True)
+        return _conn
+    _conn = pymysql.connect(
         host=DOLT_HOST,
         port=DOLT_PORT,
         user=DOLT_USER,
         database=DOLT_DB,
-        autocommit=True,
+        autocommit=False,
+        local_infile=True,
     )
+    return _conn
 
 
-def import_issue(cur: pymysql.cursors.Cursor, issue: dict) -> None:
+def issue_rows(issue: dict) -> tuple[tuple, list[tuple], list[tuple], list[tuple]]:
+    """Build the issues, labels, dependencies, and comments rows for one issue."""
     issue_id = issue["id"]
 
     # -- issues table --
-    cur.execute(
-        """INSERT INTO issues
-           (id, title, description, design, acceptance_criteria, notes,
-            status, priority, issue_type, owner, assignee,
-            created_at, created_by, updated_at, closed_at, close_reason)
-           VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-        (
-            issue_id,
-            issue.get("title", ""),
-            issue.get("description", ""),
-            issue.get("design", ""),
-            issue.get("acceptance_criteria", ""),
-            issue.get("notes", ""),
-            issue.get("status", "open"),
-            issue.get("priority", 2),
-            issue.get("issue_type", "task"),
-            issue.get("owner") or None,
-            issue.get("assignee") or None,
-            issue.get("created_at", ""),
-            issue.get("created_by") or None,
-            issue.get("updated_at", ""),
-            issue.get("closed_at") or None,
-            issue.get("close_reason") or None,
-        ),
+    # Column values are read through one bound get; literal defaults are
+    # code-object constants, so nothing is allocated per field.
+    get = issue.get
+    issue_row = (
+        issue_id,
+        get("title", ""),
+        get("description", ""),
+        get("design", ""),
+        get("acceptance_criteria", ""),
+        get("notes", ""),
+        get("status", "open"),
+        get("priority", 2),
+        get("issue_type", "task"),
+        get("owner") or None,
+        get("assignee") or None,
+        get("created_at", ""),
+        get("created_by") or None,
+        get("updated_at", ""),
+        get("closed_at") or None,
+        get("close_reason") or None,
     )
 
     # -- labels table --
-    for label in issue.get("labels", []):
-        cur.execute(
-            "INSERT INTO labels (issue_id, label) VALUES (%s, %s)",
-            (issue_id, label),
-        )
+    label_rows = [(issue_id, label) for label in issue.get("labels", ())]
 
     # -- dependencies table --
-    for dep in issue.get("dependencies", []):
-        dep_meta = dep.get("metadata", "{}")
+    dep_rows = []
+    for dep in issue.get("dependencies", ()):
+        dep_meta = dep.get("metadata", _EMPTY_META)
         if isinstance(dep_meta, dict):
-            dep_meta = json.dumps(dep_meta)
-        cur.execute(
-            """INSERT INTO dependencies
-               (issue_id, depends_on_id, type, created_at, created_by, metadata)
-               VALUES (%s, %s, %s, %s, %s, %s)""",
+            # Most dependencies carry no metadata: reuse the shared "{}".
+            dep_meta = _dumps(dep_meta) if dep_meta else _EMPTY_META
+        dep_rows.append(
             (
                 dep["issue_id"],
                 dep["depends_on_id"],
@@ -88,22 +172,269 @@ def import_issue(cur: pymysql.cursors.Cursor, issue: dict) -> None:
                 dep.get("created_at", ""),
                 dep.get("created_by") or None,
                 dep_meta,
-            ),
+            )
         )
 
     # -- comments table --
-    for comment in issue.get("comments", []):
-        cur.execute(
-            """INSERT INTO comments (id, issue_id, author, text, created_at)
-               VALUES (%s, %s, %s, %s, %s)""",
-            (
-                comment["id"],
-                comment["issue_id"],
-                comment.get("author", ""),
-                comment.get("text", ""),
-                comment.get("created_at", ""),
-            ),
+    comment_rows = [
+        (
+            comment["id"],
+            comment["issue_id"],
+            comment.get("author", ""),
+            comment.get("text", ""),
+            comment.get("created_at", ""),
         )
+        for comment in issue.get("comments", ())
+    ]
+
+    return issue_row, label_rows, dep_rows, comment_rows
+
+
+def insert_rows(
+    cur: pymysql.cursors.Cursor, sql: str, rows: list[tuple], id_col: int
+) -> list[tuple[str, str]]:
+    """Insert rows in BATCH_SIZE chunks; return (issue_id, error) per failed row.
+
+    PyMySQL rewrites a single-VALUES INSERT passed to executemany into one
+    multi-row INSERT, so each chunk loads in one round-trip instead of one per
+    row. If a chunk's statement fails, its rows are retried one at a time so
+    the offending issues can be reported (id_col is the issue ID's column).
+    """
+    errors = []
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start:start + BATCH_SIZE]
+        try:
+            cur.executemany(sql, batch)
+            continue
+        except Exception:
+            pass
+        for row in batch:
+            try:
+                cur.execute(sql, row)
+            except Exception as e:
+                errors.append((row[id_col], str(e)))
+    return errors
+
+
+def _tsv_field(value: object) -> bytes:
+    """Encode one value for LOAD DATA's default tab-separated format."""
+    if value is None:
+        return b"\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\0", "\\0")
+        .encode()
+    )
+
+
+def load_data_rows(
+    cur: pymysql.cursors.Cursor, table: str, columns: tuple[str, ...], rows: list[tuple]
+) -> bool:
+    """Bulk-load rows with LOAD DATA LOCAL INFILE; return whether all rows loaded.
+
+    The rows are written to a temporary TSV file that the client streams to
+    the server in one statement, skipping per-batch SQL parsing. LOCAL turns
+    row errors into warnings: duplicate keys are skipped, and data-conversion
+    errors (e.g. an empty timestamp or a non-numeric priority) load coerced
+    values. Any warning or short row count is therefore rolled back to a
+    savepoint and reported as False; the caller then falls back to
+    insert_rows() to load and report row by row. If the statement itself
+    fails (e.g. local_infile disabled) it is rolled back and the error
+    re-raised.
+    """
+    if not rows:
+        return True
+    with tempfile.NamedTemporaryFile(suffix=".tsv") as f:
+        f.write(b"".join(b"\t".join(map(_tsv_field, row)) + b"\n" for row in rows))
+        f.flush()
+        cur.execute("SAVEPOINT load_data")
+        try:
+            loaded = cur.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4"
+                f" ({', '.join(columns)})",
+                (f.name,),
+            )
+        except Exception:
+            cur.execute("ROLLBACK TO SAVEPOINT load_data")
+            raise
+    if loaded != len(rows) or cur.warning_count:
+        cur.execute("ROLLBACK TO SAVEPOINT load_data")
+        return False
+    return True
+
+
+def iter_issues(path: Path) -> Iterator[dict]:
+    """Yield one parsed issue per non-blank JSONL line, without buffering the file."""
+    # Binary mode: both parsers accept bytes, so lines skip the str decode.
+    # Fixed-size chunks accumulate in a bytearray (amortized O(1) extend).
+    # Only the newly read chunk is searched for the last newline, so a line
+    # spanning many chunks is not rescanned; complete lines up to that
+    # newline are split off and deleted, leaving the partial tail in `buf`.
+    buf = bytearray()
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_CHUNK_SIZE):
+            buf.extend(chunk)
+            nl = buf.rfind(b"\n", len(buf) - len(chunk))
+            if nl < 0:
+                continue
+            block = bytes(buf[:nl])
+            del buf[: nl + 1]
+            for line in block.split(b"\n"):
+                if line and not line.isspace():
+                    yield _loads(line)
+    if buf and not buf.isspace():
+        yield _loads(buf)
+
+
+def load_issues(
+    conn: pymysql.Connection, cur: pymysql.cursors.Cursor, issues: Iterable[dict]
+) -> tuple[int, list[tuple[str, str]]]:
+    """Load issues and their child rows in a single transaction.
+
+    Rows are buffered per table and flushed every BATCH_SIZE issues, so memory
+    stays bounded by the batch rather than the input size. The large tables
+    (issues, comments) are flushed with LOAD DATA LOCAL INFILE. A batch that
+    does not load cleanly falls back to multi-row INSERTs; if the server
+    refuses LOAD DATA LOCAL outright (_LOAD_DATA_REFUSED_CODES), the rest of
+    the load uses INSERTs too. Any other LOAD DATA error aborts the load.
+
+    Foreign-key and unique checks are disabled for the load and restored
+    afterwards, whether it commits or rolls back. Rows that fail are reported
+    and the rest is committed together; any other error rolls the whole load
+    back and is re-raised, even if the rollback or restore fails too.
+
+    Returns the number of issues read and (issue_id, error) for every issue or
+    row that failed.
+    """
+    inserted = [0, 0, 0, 0]
+    attempted = [0, 0, 0, 0]
+    errors: list[tuple[str, str]] = []
+    use_load_data = True
+
+    def flush(batch: tuple[list[tuple], ...]) -> list[tuple[str, str, str]]:
+        # Runs on the writer thread: failures are returned as
+        # (table, issue_id, error) for the main thread to report.
+        nonlocal use_load_data
+        failed: list[tuple[str, str, str]] = []
+        for i, ((table, sql, id_col, columns), rows) in enumerate(zip(TABLES, batch)):
+            if use_load_data and columns is not None:
+                try:
+                    loaded = load_data_rows(cur, table, columns, rows)
+                except pymysql.err.MySQLError as e:
+                    if not e.args or e.args[0] not in _LOAD_DATA_REFUSED_CODES:
+                        raise
+                    # Server refuses LOAD DATA LOCAL: stop trying for this load.
+                    use_load_data = loaded = False
+                if loaded:
+                    attempted[i] += len(rows)
+                    inserted[i] += len(rows)
+                    continue
+            table_errors = insert_rows(cur, sql, rows, id_col)
+            failed.extend((table, eid, msg) for eid, msg in table_errors)
+            attempted[i] += len(rows)
+            inserted[i] += len(rows) - len(table_errors)
+        return failed
+
+    def report(failed: list[tuple[str, str, str]]) -> None:
+        for table, eid, msg in failed:
+            print(f"  FAILED {table} row for {eid}: {msg}", file=sys.stderr)
+            errors.append((eid, msg))
+
+    cur.execute("SET FOREIGN_KEY_CHECKS=0")
+    cur.execute("SET UNIQUE_CHECKS=0")
+
+    n_issues = 0
+    last_report = time.monotonic()
+    try:
+        # One writer thread owns the connection while a batch is in flight,
+        # so parsing the next batch overlaps with the database round-trips.
+        # At most one batch is in flight (memory stays at two batches), and
+        # leaving the with-block joins the writer before commit/rollback.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            in_flight: Future[list[tuple[str, str, str]]] | None = None
+            buffers: tuple[list[tuple], ...] = ([], [], [], [])
+            for issue in issues:
+                n_issues += 1
+                try:
+                    issue_row, label_rows, dep_rows, comment_rows = issue_rows(issue)
+                except Exception as e:
+                    errors.append((issue.get("id", "?"), str(e)))
+                    print(f"  FAILED {issue.get('id', '?')}: {e}", file=sys.stderr)
+                    continue
+                if n_issues % PROGRESS_EVERY == 0 or time.monotonic() - last_report > 1.0:
+                    last_report = time.monotonic()
+                    title = issue_row[1] or ""
+                    sys.stderr.write(f"  [{n_issues}] {issue_row[0]}: {title[:60]}\n")
+                issue_buf, label_buf, dep_buf, comment_buf = buffers
+                issue_buf.append(issue_row)
+                label_buf.extend(label_rows)
+                dep_buf.extend(dep_rows)
+                comment_buf.extend(comment_rows)
+                if len(issue_buf) >= BATCH_SIZE:
+                    if in_flight is not None:
+                        report(in_flight.result())
+                    in_flight = writer.submit(flush, buffers)
+                    buffers = ([], [], [], [])
+            if in_flight is not None:
+                report(in_flight.result())
+            report(flush(buffers))
+
+        conn.commit()
+    except BaseException:
+        # Clean-up failures are only logged: the error that aborted the load
+        # is the one the caller needs to see.
+        try:
+            conn.rollback()
+        except Exception as e:
+            print(f"  rollback failed: {e}", file=sys.stderr)
+        for stmt in _RESTORE_CHECKS:
+            try:
+                cur.execute(stmt)
+            except Exception as e:
+                print(f"  {stmt} failed: {e}", file=sys.stderr)
+        raise
+    # The connection is shared (connect()), so the next caller must not
+    # inherit disabled checks.
+    for stmt in _RESTORE_CHECKS:
+        cur.execute(stmt)
+
+    for (table, _, _, _), ok, total in zip(TABLES, inserted, attempted):
+        print(f"  {table}: {ok}/{total} rows")
+    return n_issues, errors
+
+
+def dolt_commit(cur: pymysql.cursors.Cursor, message: str) -> str:
+    """Commit all tables to Dolt history with CALL DOLT_COMMIT; return the hash.
+
+    Runs on the import's own session, so no second process or handshake is
+    needed the way `bd dolt commit` would.
+    """
+    cur.execute("CALL DOLT_COMMIT('-Am', %s)", (message,))
+    return cur.fetchone()[0]
+
+
+def dry_run_counts(path: Path) -> dict[str, int]:
+    """Count issues and child rows in path in one streaming pass.
+
+    Only the list lengths are read from each parsed issue; no table rows are
+    built and nothing is written to disk.
+    """
+    n_issues = n_labels = n_deps = n_comments = 0
+    for issue in iter_issues(path):
+        n_issues += 1
+        n_labels += len(issue.get("labels", ()))
+        n_deps += len(issue.get("dependencies", ()))
+        n_comments += len(issue.get("comments", ()))
+    return {
+        "issues": n_issues,
+        "labels": n_labels,
+        "dependencies": n_deps,
+        "comments": n_comments,
+    }
 
 
 def main() -> None:
@@ -117,21 +448,14 @@ def main() -> None:
         print(f"ERROR: {jsonl_path} not found", file=sys.stderr)
         sys.exit(1)
 
-    issues = []
-    with open(jsonl_path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                issues.append(json.loads(line))
-
-    print(f"Loaded {len(issues)} issues from {jsonl_path}")
-
     if args.dry_run:
+        counts = dry_run_counts(jsonl_path)
+        print(f"Loaded {counts['issues']} issues from {jsonl_path}")
         print("[dry-run] Parsed OK. Would insert:")
-        print(f"  Issues: {len(issues)}")
-        print(f"  Labels: {sum(len(i.get('labels', [])) for i in issues)}")
-        print(f"  Dependencies: {sum(len(i.get('dependencies', [])) for i in issues)}")
-        print(f"  Comments: {sum(len(i.get('comments', [])) for i in issues)}")
+        print(f"  Issues: {counts['issues']}")
+        print(f"  Labels: {counts['labels']}")
+        print(f"  Dependencies: {counts['dependencies']}")
+        print(f"  Comments: {counts['comments']}")
         return
 
     conn = connect()
@@ -146,44 +470,35 @@ def main() -> None:
         if resp.lower() != "y":
             sys.exit(1)
 
-    # Disable FK checks for bulk import
-    cur.execute("SET FOREIGN_KEY_CHECKS=0")
-
-    errors = []
-    for i, issue in enumerate(issues, 1):
-        issue_id = issue["id"]
-        try:
-            import_issue(cur, issue)
-            print(f"  [{i}/{len(issues)}] {issue_id}: {issue.get('title', '')[:60]}")
-        except Exception as e:
-            errors.append((issue_id, str(e)))
-            print(f"  [{i}/{len(issues)}] FAILED {issue_id}: {e}", file=sys.stderr)
-
-    # Re-enable FK checks
-    cur.execute("SET FOREIGN_KEY_CHECKS=1")
+    n_issues, errors = load_issues(conn, cur, iter_issues(jsonl_path))
 
-    cur.close()
-    conn.close()
-
-    print(f"\nImported {len(issues) - len(errors)}/{len(issues)} issues")
+    failed_ids = {eid for eid, _ in errors}
+    print(f"\nLoaded {n_issues} issues from {jsonl_path}")
+    print(f"Imported {n_issues - len(failed_ids)}/{n_issues} issues")
     if errors:
         print(f"Errors ({len(errors)}):")
         for eid, msg in errors:
             print(f"  {eid}: {msg}")
 
-    # Dolt commit via bd CLI
+    # Dolt commit over the open connection; bd CLI only as a fallback.
     if not errors:
         print("\nCommitting to Dolt...")
-        result = subprocess.run(
-            ["bd", "dolt", "commit"],
-            capture_output=True, text=True,
-        )
-        print(result.stdout)
-        if result.returncode != 0:
-            print(f"Dolt commit error: {result.stderr}", file=sys.stderr)
+        try:
+            print(dolt_commit(cur, f"Import {jsonl_path.name}"))
+        except Exception as e:
+            print(f"DOLT_COMMIT failed ({e}); retrying via bd", file=sys.stderr)
+            result = subprocess.run(
+                ["bd", "dolt", "commit"],
+                capture_output=True, text=True,
+            )
+            print(result.stdout)
+            if result.returncode != 0:
+                print(f"Dolt commit error: {result.stderr}", file=sys.stderr)
     else:
         print("\nSkipping Dolt commit due to errors.")
 
+    cur.close()
+    conn.close()
 
 if __name__ == "__main__":
     main()
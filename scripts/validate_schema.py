@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Container, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
 
 
@@ -16,7 +18,7 @@ class ErrorLayer(Enum):
     SEMANTIC = "Semantic"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationError:
     layer: ErrorLayer
     element_path: str
@@ -26,22 +28,31 @@ class ValidationError:
         return f"{self.element_path}: {self.message}"
 
 
+# Element paths are only needed when an error is reported, so checks take a
+# zero-argument callable and call it on the error path.
+_Desc = Callable[[], str]
+
+
 @dataclass
 class SchemaIndex:
-    """All ID sets and metadata extracted from a parsed schema."""
-
-    phase_ids: set[str] = field(default_factory=set)
-    substep_ids: set[str] = field(default_factory=set)
-    label_ids: set[str] = field(default_factory=set)
-    role_ids: set[str] = field(default_factory=set)
-    command_ids: set[str] = field(default_factory=set)
-    axis_ids: set[str] = field(default_factory=set)
-    handoff_ids: set[str] = field(default_factory=set)
-    constraint_ids: set[str] = field(default_factory=set)
-    document_ids: set[str] = field(default_factory=set)
-    team_ids: set[str] = field(default_factory=set)
-    enum_value_ids: dict[str, set[str]] = field(default_factory=dict)
-    severity_ids: set[str] = field(default_factory=set)
+    """All ID sets and metadata extracted from a parsed schema.
+
+    The ``*_ids`` maps key each ID to a callable returning the element path of
+    its first definition, which duplicate-ID errors report when it differs.
+    """
+
+    phase_ids: dict[str, _Desc] = field(default_factory=dict)
+    substep_ids: dict[str, _Desc] = field(default_factory=dict)
+    label_ids: dict[str, _Desc] = field(default_factory=dict)
+    role_ids: dict[str, _Desc] = field(default_factory=dict)
+    command_ids: dict[str, _Desc] = field(default_factory=dict)
+    axis_ids: dict[str, _Desc] = field(default_factory=dict)
+    handoff_ids: dict[str, _Desc] = field(default_factory=dict)
+    constraint_ids: dict[str, _Desc] = field(default_factory=dict)
+    document_ids: dict[str, _Desc] = field(default_factory=dict)
+    team_ids: dict[str, _Desc] = field(default_factory=dict)
+    enum_value_ids: dict[str, frozenset[str]] = field(default_factory=dict)
+    severity_ids: Container[str] = frozenset()
 
     # Metadata for semantic checks
     phase_numbers: dict[str, int] = field(default_factory=dict)
@@ -52,42 +63,70 @@ class SchemaIndex:
     )
     label_values: dict[str, str] = field(default_factory=dict)
     axis_letters: dict[str, str] = field(default_factory=dict)
-    role_phase_refs: dict[str, set[str]] = field(default_factory=dict)
+    role_phase_refs: dict[str, frozenset[str]] = field(default_factory=dict)
+
+    # <document>/<entity type=...> → ID set its refs resolve against
+    entity_type_ids: dict[str, Container[str]] = field(default_factory=dict)
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def _elem_desc(elem: ET.Element) -> str:
+def _elem_desc(elem: ET.Element, prefix: str = "") -> str:
     tag = elem.tag
-    id_val = elem.get("id")
+    a = elem.attrib
+    id_val = a.get("id")
     if id_val:
-        return f"{tag}[@id='{id_val}']"
-    name = elem.get("name")
+        return f"{prefix}{tag}[@id='{id_val}']"
+    name = a.get("name")
     if name:
-        return f"{tag}[@name='{name}']"
-    pattern = elem.get("pattern")
+        return f"{prefix}{tag}[@name='{name}']"
+    pattern = a.get("pattern")
     if pattern:
-        return f"{tag}[@pattern='{pattern}']"
-    ref = elem.get("ref")
+        return f"{prefix}{tag}[@pattern='{pattern}']"
+    ref = a.get("ref")
     if ref:
-        return f"{tag}[@ref='{ref}']"
-    return tag
+        return f"{prefix}{tag}[@ref='{ref}']"
+    return f"{prefix}{tag}"
+
+
+def _parse_int(value: str) -> int | None:
+    # Plain digit strings skip the exception path; anything else gets int()'s
+    # full syntax (sign, whitespace, underscores) and None on failure.
+    if value.isdecimal():
+        return int(value)
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+# IDs are interned so the index maps and the ref sets share one string each.
+def _get_id(attrib: Mapping[str, str], key: str = "id") -> str | None:
+    val = attrib.get(key)
+    return sys.intern(val) if val else val
+
+
+def _skill_invocation_desc(cmd_ref: str | None) -> str:
+    return f"skill-invocation[@command-ref='{cmd_ref}']" if cmd_ref else "skill-invocation"
 
 
 def _check_required(
     errors: list[ValidationError],
-    elem_desc: str,
-    elem: ET.Element,
+    desc: _Desc,
+    attrib: Mapping[str, str],
     attrs: list[str],
 ) -> None:
+    path: str | None = None
     for attr in attrs:
-        val = elem.get(attr)
+        val = attrib.get(attr)
         if val is None or val.strip() == "":
+            if path is None:
+                path = desc()
             errors.append(
                 ValidationError(
                     layer=ErrorLayer.STRUCTURAL,
-                    element_path=elem_desc,
+                    element_path=path,
                     message=f"missing required attribute '{attr}'",
                 )
             )
@@ -95,420 +134,525 @@ def _check_required(
 
 def _check_ref(
     errors: list[ValidationError],
-    elem_desc: str,
+    desc: _Desc,
     attr_name: str,
     attr_val: str | None,
-    target_set: set[str],
+    target_set: Container[str],
     target_name: str,
 ) -> None:
     if attr_val is not None and attr_val not in target_set:
-        errors.append(
-            ValidationError(
-                layer=ErrorLayer.REFERENTIAL,
-                element_path=elem_desc,
-                message=f"{attr_name}='{attr_val}': no {target_name} with id '{attr_val}'",
-            )
-        )
+        errors.append(_ref_error(desc(), attr_name, attr_val, target_name))
+
+
+def _ref_error(
+    element_path: str, attr_name: str, attr_val: str, target_name: str
+) -> ValidationError:
+    return ValidationError(
+        layer=ErrorLayer.REFERENTIAL,
+        element_path=element_path,
+        message=f"{attr_name}='{attr_val}': no {target_name} with id '{attr_val}'",
+    )
 
 
 def _check_id_unique(
     errors: list[ValidationError],
     id_val: str,
-    id_set: set[str],
-    elem_desc: str,
+    id_map: dict[str, _Desc],
+    desc: _Desc,
     type_name: str,
 ) -> None:
-    if id_val in id_set:
+    first = id_map.setdefault(id_val, desc)
+    if first is not desc:
+        path = desc()
+        first_path = first()
+        message = f"duplicate {type_name} id '{id_val}'"
+        if first_path != path:
+            message += f" (first seen on {first_path})"
         errors.append(
             ValidationError(
                 layer=ErrorLayer.STRUCTURAL,
-                element_path=elem_desc,
-                message=f"duplicate {type_name} id '{id_val}'",
+                element_path=path,
+                message=message,
             )
         )
-    id_set.add(id_val)
 
 
 # ─── Layer 1: Structural + Index Building ────────────────────────────────────
-
-
-def build_index(root: ET.Element) -> tuple[SchemaIndex, list[ValidationError]]:
-    """Extract all IDs and check structural requirements in one pass."""
-    idx = SchemaIndex()
-    errors: list[ValidationError] = []
-
-    # Enums
-    for enum_el in root.iter("enum"):
-        enum_name = enum_el.get("name", "")
-        value_ids: set[str] = set()
-        for val in enum_el.findall("value"):
-            desc = f"enum[@name='{enum_name}']/{_elem_desc(val)}"
-            _check_required(errors, desc, val, ["id", "description"])
-            vid = val.get("id")
-            if vid:
-                if vid in value_ids:
-                    errors.append(
-                        ValidationError(
-                            layer=ErrorLayer.STRUCTURAL,
-                            element_path=desc,
-                            message=f"duplicate value id '{vid}' within enum '{enum_name}'",
-                        )
+#
+# build_index and check_refs each make a single walk over the tree and
+# dispatch on elem.tag. Handlers for container elements (phase, document,
+# severity-tree, team) look at their own subtree only. <roles> and
+# <commands> are resolved by direct-child lookup on the root so that <role>
+# and <command> elements elsewhere stay out of scope.
+
+
+def _index_enum(enum_el: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = enum_el.attrib
+    enum_name = a.get("name", "")
+    value_ids: set[str] = set()
+    prefix = f"enum[@name='{enum_name}']/"
+    for val in enum_el.findall("value"):
+        va = val.attrib
+        desc = partial(_elem_desc, val, prefix)
+        _check_required(errors, desc, va, ["id", "description"])
+        vid = _get_id(va)
+        if vid:
+            if vid in value_ids:
+                errors.append(
+                    ValidationError(
+                        layer=ErrorLayer.STRUCTURAL,
+                        element_path=desc(),
+                        message=f"duplicate value id '{vid}' within enum '{enum_name}'",
                     )
-                value_ids.add(vid)
-        idx.enum_value_ids[enum_name] = value_ids
-    idx.severity_ids = set(idx.enum_value_ids.get("SeverityLevel", set()))
-
-    # Labels
-    for label in root.iter("label"):
-        desc = _elem_desc(label)
-        _check_required(errors, desc, label, ["id", "value"])
-        lid = label.get("id")
-        if lid:
-            _check_id_unique(errors, lid, idx.label_ids, desc, "label")
-        is_special = label.get("special") == "true"
-        if not is_special:
-            _check_required(errors, desc, label, ["phase-ref", "substep-ref"])
-        val = label.get("value")
-        if lid and val:
-            idx.label_values[lid] = val
-
-    # Review axes
-    for axis in root.iter("axis"):
-        desc = _elem_desc(axis)
-        _check_required(errors, desc, axis, ["id", "letter", "name"])
-        aid = axis.get("id")
-        if aid:
-            _check_id_unique(errors, aid, idx.axis_ids, desc, "axis")
-        letter = axis.get("letter")
-        if aid and letter:
-            idx.axis_letters[aid] = letter
-
-    # Phases and substeps
-    for phase in root.iter("phase"):
-        desc = _elem_desc(phase)
-        _check_required(errors, desc, phase, ["id", "number", "domain", "name"])
-        pid = phase.get("id")
-        if pid:
-            _check_id_unique(errors, pid, idx.phase_ids, desc, "phase")
-            num_str = phase.get("number")
-            if num_str:
-                try:
-                    idx.phase_numbers[pid] = int(num_str)
-                except ValueError:
-                    errors.append(
-                        ValidationError(
-                            layer=ErrorLayer.STRUCTURAL,
-                            element_path=desc,
-                            message=f"number='{num_str}' is not a valid integer",
-                        )
+                )
+            value_ids.add(vid)
+    idx.enum_value_ids[enum_name] = frozenset(value_ids)
+
+
+def _index_label(label: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = label.attrib
+    desc = partial(_elem_desc, label)
+    _check_required(errors, desc, a, ["id", "value"])
+    lid = _get_id(a)
+    if lid:
+        _check_id_unique(errors, lid, idx.label_ids, desc, "label")
+    is_special = a.get("special") == "true"
+    if not is_special:
+        _check_required(errors, desc, a, ["phase-ref", "substep-ref"])
+    val = a.get("value")
+    if lid and val:
+        idx.label_values[lid] = val
+
+
+def _index_axis(axis: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = axis.attrib
+    desc = partial(_elem_desc, axis)
+    _check_required(errors, desc, a, ["id", "letter", "name"])
+    aid = _get_id(a)
+    if aid:
+        _check_id_unique(errors, aid, idx.axis_ids, desc, "axis")
+    letter = a.get("letter")
+    if aid and letter:
+        idx.axis_letters[aid] = letter
+
+
+def _index_phase(phase: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = phase.attrib
+    desc = partial(_elem_desc, phase)
+    _check_required(errors, desc, a, ["id", "number", "domain", "name"])
+    pid = _get_id(a)
+    if pid:
+        _check_id_unique(errors, pid, idx.phase_ids, desc, "phase")
+        num_str = a.get("number")
+        if num_str:
+            num = _parse_int(num_str)
+            if num is not None:
+                idx.phase_numbers[pid] = num
+            else:
+                errors.append(
+                    ValidationError(
+                        layer=ErrorLayer.STRUCTURAL,
+                        element_path=desc(),
+                        message=f"number='{num_str}' is not a valid integer",
+                    )
+                )
+        domain = a.get("domain")
+        if domain:
+            idx.phase_domains[pid] = domain
+
+    substep_data: list[tuple[str, int, str]] = []
+    prefix = f"{desc()}/"
+    for substep in phase.iter("substep"):
+        sa = substep.attrib
+        sdesc = partial(_elem_desc, substep, prefix)
+        _check_required(
+            errors, sdesc, sa, ["id", "type", "execution", "order", "label-ref"]
+        )
+        sid = _get_id(sa)
+        if sid:
+            _check_id_unique(errors, sid, idx.substep_ids, sdesc, "substep")
+        order_str = sa.get("order")
+        execution = sa.get("execution", "")
+        order = 0
+        if order_str:
+            parsed = _parse_int(order_str)
+            if parsed is not None:
+                order = parsed
+            else:
+                errors.append(
+                    ValidationError(
+                        layer=ErrorLayer.STRUCTURAL,
+                        element_path=sdesc(),
+                        message=f"order='{order_str}' is not a valid integer",
                     )
-            domain = phase.get("domain")
-            if domain:
-                idx.phase_domains[pid] = domain
+                )
+        # Startup sequence steps
+        startup_seq = substep.find("startup-sequence")
+        if startup_seq is not None:
+            step_orders: list[int] = []
+            for step_el in startup_seq.findall("step"):
+                step_a = step_el.attrib
+
+                def step_desc() -> str:
+                    return f"{sdesc()}/startup-sequence/step[@order='{step_a.get('order', '')}']"
+
+                _check_required(errors, step_desc, step_a, ["order"])
+                sorder_str = step_a.get("order")
+                if sorder_str:
+                    step_order = _parse_int(sorder_str)
+                    if step_order is not None:
+                        step_orders.append(step_order)
+                    else:
+                        errors.append(
+                            ValidationError(
+                                layer=ErrorLayer.STRUCTURAL,
+                                element_path=step_desc(),
+                                message=f"order='{sorder_str}' is not a valid integer",
+                            )
+                        )
+            if sid:
+                idx.startup_step_orders[sid] = step_orders
+
+        if sid:
+            substep_data.append((sid, order, execution))
+    if pid:
+        idx.phase_substep_orders[pid] = substep_data
+
+
+def _index_role(role: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = role.attrib
+    desc = partial(_elem_desc, role)
+    _check_required(errors, desc, a, ["id", "name"])
+    rid = _get_id(a)
+    if not rid:
+        return
+    _check_id_unique(errors, rid, idx.role_ids, desc, "role")
+    phase_refs: set[str] = set()
+    owns_phases = role.find("owns-phases")
+    if owns_phases is not None:
+        for pr in owns_phases.findall("phase-ref"):
+            ref = _get_id(pr.attrib, "ref")
+            if ref:
+                phase_refs.add(ref)
+    idx.role_phase_refs[rid] = frozenset(phase_refs)
+
+    # Standing teams
+    for team in role.iter("team"):
+        ta = team.attrib
+        team_desc = partial(_elem_desc, team, f"{desc()}/standing-teams/")
+        _check_required(errors, team_desc, ta, ["id"])
+        tid = _get_id(ta)
+        if tid:
+            _check_id_unique(errors, tid, idx.team_ids, team_desc, "team")
+        for agent_tmpl in team.findall("agent-template"):
+            at_a = agent_tmpl.attrib
+
+            def at_desc() -> str:
+                return f"{team_desc()}/agent-template"
 
-        substep_data: list[tuple[str, int, str]] = []
-        for substep in phase.iter("substep"):
-            sdesc = f"{desc}/{_elem_desc(substep)}"
             _check_required(
-                errors, sdesc, substep, ["id", "type", "execution", "order", "label-ref"]
+                errors, at_desc, at_a,
+                ["role", "skill-ref", "invocation", "min-count", "max-count"],
             )
-            sid = substep.get("id")
-            if sid:
-                _check_id_unique(errors, sid, idx.substep_ids, sdesc, "substep")
-            order_str = substep.get("order")
-            execution = substep.get("execution", "")
-            order = 0
-            if order_str:
-                try:
-                    order = int(order_str)
-                except ValueError:
+            for count_attr in ("min-count", "max-count"):
+                count_str = at_a.get(count_attr)
+                if count_str and _parse_int(count_str) is None:
                     errors.append(
                         ValidationError(
                             layer=ErrorLayer.STRUCTURAL,
-                            element_path=sdesc,
-                            message=f"order='{order_str}' is not a valid integer",
+                            element_path=at_desc(),
+                            message=f"{count_attr}='{count_str}' is not a valid integer",
                         )
                     )
-            # Startup sequence steps
-            startup_seq = substep.find("startup-sequence")
-            if startup_seq is not None:
-                step_orders: list[int] = []
-                for step_el in startup_seq.findall("step"):
-                    step_desc = f"{sdesc}/startup-sequence/step[@order='{step_el.get('order', '')}']"
-                    _check_required(errors, step_desc, step_el, ["order"])
-                    sorder_str = step_el.get("order")
-                    if sorder_str:
-                        try:
-                            step_orders.append(int(sorder_str))
-                        except ValueError:
-                            errors.append(
-                                ValidationError(
-                                    layer=ErrorLayer.STRUCTURAL,
-                                    element_path=step_desc,
-                                    message=f"order='{sorder_str}' is not a valid integer",
-                                )
-                            )
-                if sid:
-                    idx.startup_step_orders[sid] = step_orders
 
-            if sid:
-                substep_data.append((sid, order, execution))
-        if pid:
-            idx.phase_substep_orders[pid] = substep_data
+
+def _index_command(cmd: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = cmd.attrib
+    desc = partial(_elem_desc, cmd)
+    _check_required(errors, desc, a, ["id", "name"])
+    cid = _get_id(a)
+    if cid:
+        _check_id_unique(errors, cid, idx.command_ids, desc, "command")
+
+
+def _index_handoff(handoff: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = handoff.attrib
+    desc = partial(_elem_desc, handoff)
+    _check_required(
+        errors,
+        desc,
+        a,
+        ["id", "source-role", "target-role", "at-phase", "content-level"],
+    )
+    hid = _get_id(a)
+    if hid:
+        _check_id_unique(errors, hid, idx.handoff_ids, desc, "handoff")
+
+
+def _index_constraint(constraint: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = constraint.attrib
+    desc = partial(_elem_desc, constraint)
+    _check_required(
+        errors, desc, a, ["id", "given", "when", "then", "should-not"]
+    )
+    cid = _get_id(a)
+    if cid:
+        _check_id_unique(errors, cid, idx.constraint_ids, desc, "constraint")
+
+
+def _index_document(doc: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = doc.attrib
+    desc = partial(_elem_desc, doc)
+    _check_required(errors, desc, a, ["id", "path"])
+    did = _get_id(a)
+    if did:
+        _check_id_unique(errors, did, idx.document_ids, desc, "document")
+
+
+def _index_title_convention(tc: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = tc.attrib
+    desc = partial(_elem_desc, tc)
+    _check_required(errors, desc, a, ["pattern", "label-ref", "created-by"])
+
+
+def _index_skill_invocation(si: ET.Element, idx: SchemaIndex, errors: list[ValidationError]) -> None:
+    # Structural: directive required
+    a = si.attrib
+    _check_required(
+        errors, partial(_skill_invocation_desc, a.get("command-ref")), a, ["directive"]
+    )
+
+
+_IndexHandler = Callable[[ET.Element, SchemaIndex, list[ValidationError]], None]
+
+_INDEX_HANDLERS: dict[str, _IndexHandler] = {
+    "enum": _index_enum,
+    "label": _index_label,
+    "axis": _index_axis,
+    "phase": _index_phase,
+    "handoff": _index_handoff,
+    "constraint": _index_constraint,
+    "document": _index_document,
+    "title-convention": _index_title_convention,
+    "skill-invocation": _index_skill_invocation,
+}
+
+
+def build_index(root: ET.Element) -> tuple[SchemaIndex, list[ValidationError]]:
+    """Extract all IDs and check structural requirements in one pass."""
+    idx = SchemaIndex()
+    errors: list[ValidationError] = []
+
+    handlers = _INDEX_HANDLERS
+    for el in root.iter():
+        handler = handlers.get(el.tag)
+        if handler is not None:
+            handler(el, idx, errors)
+    idx.severity_ids = idx.enum_value_ids.get("SeverityLevel", frozenset())
 
     # Roles (only under <roles> section — other <role> elements e.g. in
     # <procedure-steps> use ref= not id=/name= and are validated separately)
     roles_el = root.find("roles")
     for role in (roles_el.findall("role") if roles_el is not None else []):
-        desc = _elem_desc(role)
-        _check_required(errors, desc, role, ["id", "name"])
-        rid = role.get("id")
-        if rid:
-            _check_id_unique(errors, rid, idx.role_ids, desc, "role")
-            phase_refs: set[str] = set()
-            owns_phases = role.find("owns-phases")
-            if owns_phases is not None:
-                for pr in owns_phases.findall("phase-ref"):
-                    ref = pr.get("ref")
-                    if ref:
-                        phase_refs.add(ref)
-            idx.role_phase_refs[rid] = phase_refs
-
-            # Standing teams
-            for team in role.iter("team"):
-                team_desc = f"{desc}/standing-teams/{_elem_desc(team)}"
-                _check_required(errors, team_desc, team, ["id"])
-                tid = team.get("id")
-                if tid:
-                    _check_id_unique(errors, tid, idx.team_ids, team_desc, "team")
-                for agent_tmpl in team.findall("agent-template"):
-                    at_desc = f"{team_desc}/agent-template"
-                    _check_required(
-                        errors, at_desc, agent_tmpl,
-                        ["role", "skill-ref", "invocation", "min-count", "max-count"],
-                    )
-                    for count_attr in ("min-count", "max-count"):
-                        count_str = agent_tmpl.get(count_attr)
-                        if count_str:
-                            try:
-                                int(count_str)
-                            except ValueError:
-                                errors.append(
-                                    ValidationError(
-                                        layer=ErrorLayer.STRUCTURAL,
-                                        element_path=at_desc,
-                                        message=f"{count_attr}='{count_str}' is not a valid integer",
-                                    )
-                                )
+        _index_role(role, idx, errors)
 
     # Commands (only within <commands> section, not <command> text elements elsewhere)
     commands_section = root.find("commands")
     if commands_section is not None:
         for cmd in commands_section.findall("command"):
-            desc = _elem_desc(cmd)
-            _check_required(errors, desc, cmd, ["id", "name"])
-            cid = cmd.get("id")
-            if cid:
-                _check_id_unique(errors, cid, idx.command_ids, desc, "command")
-
-    # Handoffs
-    for handoff in root.iter("handoff"):
-        desc = _elem_desc(handoff)
-        _check_required(
+            _index_command(cmd, idx, errors)
+
+    idx.entity_type_ids = {
+        "phase": idx.phase_ids,
+        "substep": idx.substep_ids,
+        "label": idx.label_ids,
+        "role": idx.role_ids,
+        "command": idx.command_ids,
+        "constraint": idx.constraint_ids,
+        "handoff": idx.handoff_ids,
+        "review-axis": idx.axis_ids,
+        "severity": idx.severity_ids,
+        "vote": idx.enum_value_ids.get("VoteType", frozenset()),
+    }
+
+    return idx, errors
+
+
+# ─── Layer 2: Referential Integrity ──────────────────────────────────────────
+
+
+def _refs_transition(t: ET.Element, index: SchemaIndex, errors: list[ValidationError]) -> None:
+    # Skip "complete" as a terminal sentinel
+    a = t.attrib
+    to_phase = a.get("to-phase")
+    if to_phase is not None and to_phase != "complete":
+        _check_ref(
             errors,
-            desc,
-            handoff,
-            ["id", "source-role", "target-role", "at-phase", "content-level"],
+            lambda: f"transition[@to-phase='{to_phase}']",
+            "to-phase",
+            to_phase,
+            index.phase_ids,
+            "phase",
         )
-        hid = handoff.get("id")
-        if hid:
-            _check_id_unique(errors, hid, idx.handoff_ids, desc, "handoff")
 
-    # Constraints
-    for constraint in root.iter("constraint"):
-        desc = _elem_desc(constraint)
-        _check_required(
-            errors, desc, constraint, ["id", "given", "when", "then", "should-not"]
-        )
-        cid = constraint.get("id")
-        if cid:
-            _check_id_unique(errors, cid, idx.constraint_ids, desc, "constraint")
-
-    # Documents
-    for doc in root.iter("document"):
-        desc = _elem_desc(doc)
-        _check_required(errors, desc, doc, ["id", "path"])
-        did = doc.get("id")
-        if did:
-            _check_id_unique(errors, did, idx.document_ids, desc, "document")
-
-    # Title conventions
-    for tc in root.iter("title-convention"):
-        desc = _elem_desc(tc)
-        _check_required(errors, desc, tc, ["pattern", "label-ref", "created-by"])
-
-    # Skill invocations (structural: directive required)
-    for si in root.iter("skill-invocation"):
-        cmd_ref = si.get("command-ref")
-        si_desc = f"skill-invocation[@command-ref='{cmd_ref}']" if cmd_ref else "skill-invocation"
-        _check_required(errors, si_desc, si, ["directive"])
 
-    return idx, errors
+def _refs_severity_tree(st: ET.Element, index: SchemaIndex, errors: list[ValidationError]) -> None:
+    for g in st.findall("group"):
+        ga = g.attrib
 
+        def g_desc() -> str:
+            return f"severity-tree/group[@severity-ref='{ga.get('severity-ref', '')}']"
 
-# ─── Layer 2: Referential Integrity ──────────────────────────────────────────
+        _check_ref(errors, g_desc, "severity-ref", ga.get("severity-ref"), index.severity_ids, "severity")
+        _check_ref(errors, g_desc, "label-ref", ga.get("label-ref"), index.label_ids, "label")
+
+
+def _refs_delegate(d: ET.Element, index: SchemaIndex, errors: list[ValidationError]) -> None:
+    # phases is comma-separated
+    a = d.attrib
+
+    def d_desc() -> str:
+        return f"delegate[@to-role='{a.get('to-role', '')}']"
+
+    _check_ref(errors, d_desc, "to-role", a.get("to-role"), index.role_ids, "role")
+    phases_str = a.get("phases", "")
+    if phases_str:
+        for p in phases_str.split(","):
+            p = p.strip()
+            if p:
+                _check_ref(errors, d_desc, "phases", p, index.phase_ids, "phase")
 
 
-_ENTITY_TYPE_MAP: dict[str, str] = {
-    "phase": "phase_ids",
-    "substep": "substep_ids",
-    "label": "label_ids",
-    "role": "role_ids",
-    "command": "command_ids",
-    "constraint": "constraint_ids",
-    "handoff": "handoff_ids",
-    "review-axis": "axis_ids",
-    "severity": "severity_ids",
+def _refs_skill_invocation(si: ET.Element, index: SchemaIndex, errors: list[ValidationError]) -> None:
+    a = si.attrib
+    cmd_ref = a.get("command-ref")
+    si_desc = partial(_skill_invocation_desc, cmd_ref)
+    _check_ref(errors, si_desc, "command-ref", cmd_ref, index.command_ids, "command")
+
+
+def _refs_document(
+    doc: ET.Element,
+    index: SchemaIndex,
+    errors: list[ValidationError],
+    *,
+    misses: dict[tuple[str, str], tuple[str, ...]],
+) -> None:
+    # Entity refs are comma-separated or a wildcard. Documents repeat the same
+    # entity lists, so unresolved refs are memoized in `misses`, keyed by
+    # (type, refs); check_refs passes a fresh dict per call.
+    doc_desc = partial(_elem_desc, doc)
+    entity_type_ids = index.entity_type_ids
+    for entity in doc.iter("entity"):
+        ea = entity.attrib
+        refs = ea.get("refs", "")
+        if refs in ("all", "all-protocol", ""):
+            continue
+        type_attr = ea.get("type", "")
+        if type_attr == "all":
+            continue
+        target_set = entity_type_ids.get(type_attr)
+        if target_set is None:
+            continue
+
+        key = (type_attr, refs)
+        unresolved = misses.get(key)
+        if unresolved is None:
+            stripped = (ref.strip() for ref in refs.split(","))
+            unresolved = misses[key] = tuple(
+                ref for ref in stripped if ref and ref not in target_set
+            )
+        if unresolved:
+            e_desc = f"{doc_desc()}/entity[@type='{type_attr}']"
+            for ref in unresolved:
+                errors.append(_ref_error(e_desc, "refs", ref, type_attr))
+
+
+def _ref_child_desc(el: ET.Element) -> str:
+    return f"{el.tag}[@ref='{el.get('ref')}']"
+
+
+def _tag_desc(el: ET.Element) -> str:
+    return el.tag
+
+
+# Plain attribute references: tag → (element path builder, ((attribute,
+# target kind), ...)). Target kinds are resolved by check_refs.
+_REF_TABLE: dict[str, tuple[Callable[[ET.Element], str], tuple[tuple[str, str], ...]]] = {
+    "label": (
+        _elem_desc,
+        (("phase-ref", "phase"), ("substep-ref", "substep"), ("severity-ref", "severity")),
+    ),
+    "substep": (_elem_desc, (("label-ref", "label"),)),
+    "extra-label": (_elem_desc, (("ref", "label"),)),
+    "phase-ref": (_ref_child_desc, (("ref", "phase"),)),
+    "label-ref": (_ref_child_desc, (("ref", "label"),)),
+    "axis-ref": (_ref_child_desc, (("ref", "axis"),)),
+    "handoff": (
+        _elem_desc,
+        (("source-role", "role"), ("target-role", "role"), ("at-phase", "phase")),
+    ),
+    "same-actor-as": (_tag_desc, (("phase-ref", "phase"),)),
+    "title-convention": (
+        _elem_desc,
+        (("label-ref", "label"), ("phase-ref", "phase"), ("extra-label-ref", "label")),
+    ),
+    "followup-epic": (_tag_desc, (("label-ref", "label"),)),
+    "agent-template": (_elem_desc, (("skill-ref", "command"),)),
 }
 
+_RefHandler = Callable[[ET.Element, SchemaIndex, list[ValidationError]], None]
 
-def _entity_type_to_set(type_attr: str, index: SchemaIndex) -> set[str] | None:
-    field_name = _ENTITY_TYPE_MAP.get(type_attr)
-    if field_name:
-        return getattr(index, field_name)
-    if type_attr == "vote":
-        return index.enum_value_ids.get("VoteType", set())
-    return None
+# Elements whose references need more than an attribute lookup
+_REF_HANDLERS: dict[str, _RefHandler] = {
+    "transition": _refs_transition,
+    "severity-tree": _refs_severity_tree,
+    "delegate": _refs_delegate,
+    "skill-invocation": _refs_skill_invocation,
+}
 
 
 def check_refs(root: ET.Element, index: SchemaIndex) -> list[ValidationError]:
     """Check all cross-references resolve to existing IDs."""
     errors: list[ValidationError] = []
 
-    # Labels: phase-ref, substep-ref, severity-ref
-    for label in root.iter("label"):
-        desc = _elem_desc(label)
-        _check_ref(errors, desc, "phase-ref", label.get("phase-ref"), index.phase_ids, "phase")
-        _check_ref(errors, desc, "substep-ref", label.get("substep-ref"), index.substep_ids, "substep")
-        _check_ref(errors, desc, "severity-ref", label.get("severity-ref"), index.severity_ids, "severity")
-
-    # Substeps: label-ref
-    for substep in root.iter("substep"):
-        desc = _elem_desc(substep)
-        _check_ref(errors, desc, "label-ref", substep.get("label-ref"), index.label_ids, "label")
-
-    # Extra-label: ref
-    for el in root.iter("extra-label"):
-        desc = _elem_desc(el)
-        _check_ref(errors, desc, "ref", el.get("ref"), index.label_ids, "label")
+    target_sets: dict[str, Container[str]] = {
+        "phase": index.phase_ids,
+        "substep": index.substep_ids,
+        "label": index.label_ids,
+        "role": index.role_ids,
+        "command": index.command_ids,
+        "axis": index.axis_ids,
+        "severity": index.severity_ids,
+    }
+    table = _REF_TABLE
+    # <document> gets its entity-ref memo here, scoped to this call.
+    handlers: dict[str, _RefHandler] = {
+        **_REF_HANDLERS,
+        "document": partial(_refs_document, misses={}),
+    }
+    for el in root.iter():
+        tag = el.tag
+        entry = table.get(tag)
+        if entry is not None:
+            # Inlined _check_ref: most refs resolve, so skip the call
+            desc_fn, refs = entry
+            a = el.attrib
+            for attr, kind in refs:
+                val = a.get(attr)
+                if val is not None and val not in target_sets[kind]:
+                    errors.append(_ref_error(desc_fn(el), attr, val, kind))
+            continue
+        handler = handlers.get(tag)
+        if handler is not None:
+            handler(el, index, errors)
 
     # Commands: role-ref (scoped to <commands> section)
     commands_section = root.find("commands")
     if commands_section is not None:
         for cmd in commands_section.findall("command"):
-            desc = _elem_desc(cmd)
-            _check_ref(errors, desc, "role-ref", cmd.get("role-ref"), index.role_ids, "role")
-
-    # phase-ref child elements: ref → phase_ids
-    for el in root.iter("phase-ref"):
-        ref = el.get("ref")
-        if ref is not None:
-            _check_ref(errors, f"phase-ref[@ref='{ref}']", "ref", ref, index.phase_ids, "phase")
-
-    # label-ref child elements: ref → label_ids
-    for el in root.iter("label-ref"):
-        ref = el.get("ref")
-        if ref is not None:
-            _check_ref(errors, f"label-ref[@ref='{ref}']", "ref", ref, index.label_ids, "label")
-
-    # axis-ref child elements: ref → axis_ids
-    for el in root.iter("axis-ref"):
-        ref = el.get("ref")
-        if ref is not None:
-            _check_ref(errors, f"axis-ref[@ref='{ref}']", "ref", ref, index.axis_ids, "axis")
-
-    # Handoffs: source-role, target-role, at-phase
-    for handoff in root.iter("handoff"):
-        desc = _elem_desc(handoff)
-        _check_ref(errors, desc, "source-role", handoff.get("source-role"), index.role_ids, "role")
-        _check_ref(errors, desc, "target-role", handoff.get("target-role"), index.role_ids, "role")
-        _check_ref(errors, desc, "at-phase", handoff.get("at-phase"), index.phase_ids, "phase")
-
-    # Transitions: to-phase (skip "complete" as a terminal sentinel)
-    for t in root.iter("transition"):
-        to_phase = t.get("to-phase")
-        if to_phase is not None and to_phase != "complete":
-            _check_ref(
-                errors,
-                f"transition[@to-phase='{to_phase}']",
-                "to-phase",
-                to_phase,
-                index.phase_ids,
-                "phase",
-            )
-
-    # same-actor-as: phase-ref
-    for el in root.iter("same-actor-as"):
-        _check_ref(errors, "same-actor-as", "phase-ref", el.get("phase-ref"), index.phase_ids, "phase")
-
-    # Title conventions: label-ref, phase-ref, extra-label-ref
-    for tc in root.iter("title-convention"):
-        desc = _elem_desc(tc)
-        _check_ref(errors, desc, "label-ref", tc.get("label-ref"), index.label_ids, "label")
-        _check_ref(errors, desc, "phase-ref", tc.get("phase-ref"), index.phase_ids, "phase")
-        _check_ref(errors, desc, "extra-label-ref", tc.get("extra-label-ref"), index.label_ids, "label")
-
-    # severity-tree groups: severity-ref, label-ref
-    for st in root.iter("severity-tree"):
-        for g in st.findall("group"):
-            g_desc = f"severity-tree/group[@severity-ref='{g.get('severity-ref', '')}']"
-            _check_ref(errors, g_desc, "severity-ref", g.get("severity-ref"), index.severity_ids, "severity")
-            _check_ref(errors, g_desc, "label-ref", g.get("label-ref"), index.label_ids, "label")
-
-    # followup-epic: label-ref
-    for fe in root.iter("followup-epic"):
-        _check_ref(errors, "followup-epic", "label-ref", fe.get("label-ref"), index.label_ids, "label")
-
-    # delegate: to-role, phases (comma-separated)
-    for d in root.iter("delegate"):
-        d_desc = f"delegate[@to-role='{d.get('to-role', '')}']"
-        _check_ref(errors, d_desc, "to-role", d.get("to-role"), index.role_ids, "role")
-        phases_str = d.get("phases", "")
-        if phases_str:
-            for p in phases_str.split(","):
-                p = p.strip()
-                if p:
-                    _check_ref(errors, d_desc, "phases", p, index.phase_ids, "phase")
-
-    # Skill invocations: command-ref → command_ids
-    for si in root.iter("skill-invocation"):
-        cmd_ref = si.get("command-ref")
-        si_desc = f"skill-invocation[@command-ref='{cmd_ref}']" if cmd_ref else "skill-invocation"
-        _check_ref(errors, si_desc, "command-ref", cmd_ref, index.command_ids, "command")
-
-    # Agent templates: skill-ref → command_ids
-    for at in root.iter("agent-template"):
-        at_desc = _elem_desc(at)
-        _check_ref(errors, at_desc, "skill-ref", at.get("skill-ref"), index.command_ids, "command")
-
-    # Document entities: refs (comma-separated or wildcard)
-    for doc in root.iter("document"):
-        doc_desc = _elem_desc(doc)
-        for entity in doc.iter("entity"):
-            refs = entity.get("refs", "")
-            if refs in ("all", "all-protocol", ""):
-                continue
-            type_attr = entity.get("type", "")
-            if type_attr == "all":
-                continue
-            target_set = _entity_type_to_set(type_attr, index)
-            if target_set is None:
-                continue
-            e_desc = f"{doc_desc}/entity[@type='{type_attr}']"
-            for ref in refs.split(","):
-                ref = ref.strip()
-                if ref:
-                    _check_ref(errors, e_desc, "refs", ref, target_set, type_attr)
+            a = cmd.attrib
+            desc = partial(_elem_desc, cmd)
+            _check_ref(errors, desc, "role-ref", a.get("role-ref"), index.role_ids, "role")
 
     return errors
 
@@ -522,41 +666,64 @@ _EXPECTED_DOMAINS: dict[int, str] = {
 }
 
 
+def _is_one_to_n(values: list[int]) -> bool:
+    """True if ``values`` is a permutation of 1..len(values).
+
+    Equivalent to ``sorted(values) == list(range(1, len(values) + 1))`` for a
+    non-empty list, without sorting or building the expected list.
+    """
+    n = len(values)
+    distinct = set(values)
+    return len(distinct) == n and min(distinct) == 1 and max(distinct) == n
+
+
 def check_semantics(root: ET.Element, index: SchemaIndex) -> list[ValidationError]:
     """Check protocol-level semantic rules."""
     errors: list[ValidationError] = []
 
     # 1. Phase numbers sequential (contiguous 1..N)
-    numbers = sorted(index.phase_numbers.values())
-    if numbers:
-        expected = list(range(1, len(numbers) + 1))
-        if numbers != expected:
-            missing = set(expected) - set(numbers)
-            errors.append(
-                ValidationError(
-                    layer=ErrorLayer.SEMANTIC,
-                    element_path="phases",
-                    message=f"Phase numbers not sequential: found {numbers}"
-                    + (f" (missing {sorted(missing)})" if missing else ""),
-                )
+    numbers = list(index.phase_numbers.values())
+    if numbers and not _is_one_to_n(numbers):
+        missing = set(range(1, len(numbers) + 1)).difference(numbers)
+        errors.append(
+            ValidationError(
+                layer=ErrorLayer.SEMANTIC,
+                element_path="phases",
+                message=f"Phase numbers not sequential: found {sorted(numbers)}"
+                + (f" (missing {sorted(missing)})" if missing else ""),
             )
+        )
 
-    # 2. Phase domain consistency
-    for pid, num in index.phase_numbers.items():
+    # Per-phase rules (2, 3, 4, 14) share one pass over the phase IDs
+    domain_enum_values = index.enum_value_ids.get("DomainType", frozenset())
+    for pid in index.phase_ids:
+        num = index.phase_numbers.get(pid)
         domain = index.phase_domains.get(pid)
-        expected_domain = _EXPECTED_DOMAINS.get(num)
-        if domain and expected_domain and domain != expected_domain:
+
+        # 2. Phase domain consistency
+        if num is not None:
+            expected_domain = _EXPECTED_DOMAINS.get(num)
+            if domain and expected_domain and domain != expected_domain:
+                errors.append(
+                    ValidationError(
+                        layer=ErrorLayer.SEMANTIC,
+                        element_path=f"phase[@id='{pid}']",
+                        message=f"domain='{domain}' but phase {num} should be '{expected_domain}'",
+                    )
+                )
+
+        # 14. Domain enum values match phase domains
+        if domain and domain_enum_values and domain not in domain_enum_values:
             errors.append(
                 ValidationError(
                     layer=ErrorLayer.SEMANTIC,
                     element_path=f"phase[@id='{pid}']",
-                    message=f"domain='{domain}' but phase {num} should be '{expected_domain}'",
+                    message=f"domain='{domain}' not in DomainType enum {sorted(domain_enum_values)}",
                 )
             )
 
-    # 3. Each phase has >= 1 substep
-    for pid in index.phase_ids:
-        substeps = index.phase_substep_orders.get(pid, [])
+        # 3. Each phase has >= 1 substep
+        substeps = index.phase_substep_orders.get(pid)
         if not substeps:
             errors.append(
                 ValidationError(
@@ -565,19 +732,20 @@ def check_semantics(root: ET.Element, index: SchemaIndex) -> list[ValidationErro
                     message="phase has no substeps",
                 )
             )
-
-    # 4. Substep order sequential within phase (starting from 1)
-    for pid, substeps in index.phase_substep_orders.items():
-        if not substeps:
             continue
-        orders = sorted(set(s[1] for s in substeps))
-        expected_orders = list(range(1, max(orders) + 1)) if orders else []
-        if orders != expected_orders:
+
+        # 4. Substep order sequential within phase (starting from 1).
+        # Parallel substeps share an order, so compare the distinct orders:
+        # they are exactly 1..max iff the smallest is 1 and there are max of them.
+        orders = {s[1] for s in substeps}
+        max_order = max(orders)
+        if min(orders) != 1 or len(orders) != max_order:
+            expected_orders = list(range(1, max_order + 1))
             errors.append(
                 ValidationError(
                     layer=ErrorLayer.SEMANTIC,
                     element_path=f"phase[@id='{pid}']",
-                    message=f"substep orders not sequential: found {orders}, expected {expected_orders}",
+                    message=f"substep orders not sequential: found {sorted(orders)}, expected {expected_orders}",
                 )
             )
 
@@ -601,16 +769,15 @@ def check_semantics(root: ET.Element, index: SchemaIndex) -> list[ValidationErro
     # 6. Label value uniqueness
     seen_values: dict[str, str] = {}
     for lid, val in index.label_values.items():
-        if val in seen_values:
+        first_lid = seen_values.setdefault(val, lid)
+        if first_lid != lid:
             errors.append(
                 ValidationError(
                     layer=ErrorLayer.SEMANTIC,
                     element_path=f"label[@id='{lid}']",
-                    message=f"duplicate value '{val}' (first seen on label[@id='{seen_values[val]}'])",
+                    message=f"duplicate value '{val}' (first seen on label[@id='{first_lid}'])",
                 )
             )
-        else:
-            seen_values[val] = lid
 
     # 9. Each role owns >= 1 phase
     for rid, phases in index.role_phase_refs.items():
@@ -638,59 +805,43 @@ def check_semantics(root: ET.Element, index: SchemaIndex) -> list[ValidationErro
     # 11. Review axis letters unique
     seen_letters: dict[str, str] = {}
     for aid, letter in index.axis_letters.items():
-        if letter in seen_letters:
+        first_aid = seen_letters.setdefault(letter, aid)
+        if first_aid != aid:
             errors.append(
                 ValidationError(
                     layer=ErrorLayer.SEMANTIC,
                     element_path=f"axis[@id='{aid}']",
-                    message=f"duplicate letter '{letter}' (first seen on axis[@id='{seen_letters[letter]}'])",
+                    message=f"duplicate letter '{letter}' (first seen on axis[@id='{first_aid}'])",
                 )
             )
-        else:
-            seen_letters[letter] = aid
 
     # 12. Startup sequence step orders sequential
     for sid, orders in index.startup_step_orders.items():
-        if orders:
-            sorted_orders = sorted(orders)
+        if orders and not _is_one_to_n(orders):
             expected = list(range(1, len(orders) + 1))
-            if sorted_orders != expected:
-                errors.append(
-                    ValidationError(
-                        layer=ErrorLayer.SEMANTIC,
-                        element_path=f"substep[@id='{sid}']/startup-sequence",
-                        message=f"step orders not sequential: found {sorted_orders}, expected {expected}",
-                    )
+            errors.append(
+                ValidationError(
+                    layer=ErrorLayer.SEMANTIC,
+                    element_path=f"substep[@id='{sid}']/startup-sequence",
+                    message=f"step orders not sequential: found {sorted(orders)}, expected {expected}",
                 )
+            )
 
     # 13. Agent template min-count <= max-count
     for at in root.iter("agent-template"):
         min_str = at.get("min-count")
         max_str = at.get("max-count")
         if min_str and max_str:
-            try:
-                if int(min_str) > int(max_str):
-                    at_desc = _elem_desc(at) or "agent-template"
-                    errors.append(
-                        ValidationError(
-                            layer=ErrorLayer.SEMANTIC,
-                            element_path=at_desc,
-                            message=f"min-count ({min_str}) > max-count ({max_str})",
-                        )
-                    )
-            except ValueError:
-                pass  # Non-integer caught by structural layer
-
-    # 14. Domain enum values match phase domains
-    domain_enum_values = index.enum_value_ids.get("DomainType", set())
-    if domain_enum_values:
-        for pid, domain in index.phase_domains.items():
-            if domain not in domain_enum_values:
+            # Non-integers are reported by the structural layer
+            min_count = _parse_int(min_str)
+            max_count = _parse_int(max_str)
+            if min_count is not None and max_count is not None and min_count > max_count:
+                at_desc = _elem_desc(at) or "agent-template"
                 errors.append(
                     ValidationError(
                         layer=ErrorLayer.SEMANTIC,
-                        element_path=f"phase[@id='{pid}']",
-                        message=f"domain='{domain}' not in DomainType enum {sorted(domain_enum_values)}",
+                        element_path=at_desc,
+                        message=f"min-count ({min_str}) > max-count ({max_str})",
                     )
                 )
 
@@ -709,18 +860,35 @@ def validate_tree(root: ET.Element) -> list[ValidationError]:
 
 
 def validate(path: Path) -> list[ValidationError]:
-    """Run all validation layers. Convenience wrapper that handles parsing."""
+    """Run all validation layers. Convenience wrapper that handles parsing.
+
+    Results are cached per resolved path, inode, change and modification
+    time, and size, so re-validating an unchanged file does not re-parse it.
+    A same-size rewrite within the filesystem's timestamp granularity can
+    still hit a stale entry.
+    """
+    resolved = Path(path).resolve()
+    st = resolved.stat()
+    return list(
+        _validate_file(str(resolved), st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+    )
+
+
+@lru_cache(maxsize=8)
+def _validate_file(
+    path: str, ino: int, ctime_ns: int, mtime_ns: int, size: int
+) -> tuple[ValidationError, ...]:
     try:
         tree = ET.parse(path)
     except ET.ParseError as e:
-        return [
+        return (
             ValidationError(
                 layer=ErrorLayer.STRUCTURAL,
-                element_path=str(path),
+                element_path=path,
                 message=f"XML parse error: {e}",
-            )
-        ]
-    return validate_tree(tree.getroot())
+            ),
+        )
+    return tuple(validate_tree(tree.getroot()))
 
 
 # ─── CLI ──────────────────────────────────────────────────────────────────────
@@ -1,17 +1,19 @@
 """Shared pytest fixtures and helpers for aura_protocol test suite.
 
 Provides:
-- Module-level helper functions (_advance_to, _make_state) importable directly
+- Module-level helper functions (_advance_to, _make_state, ...) importable directly
   by any test module that needs them without going through pytest fixture injection.
 - pytest fixtures for common EpochStateMachine setup patterns.
-- Module-level _PROTOCOL_FIXTURE singleton for YAML-driven combinatorial tests.
+- A lazily loaded ProtocolFixture singleton for YAML-driven combinatorial tests.
 
 Module-level helpers (import directly):
     _advance_to(sm, target) — drive a state machine through the forward phase path.
+    _record_full_accept(sm) — record ACCEPT on all 3 review axes.
     _make_state(phase, epoch_id, **kwargs) — construct a bare EpochState.
 
 Module-level fixtures (import directly):
-    _PROTOCOL_FIXTURE — ProtocolFixture singleton (loaded once, shared across tests).
+    _get_protocol_fixture() — ProtocolFixture singleton (loaded on first call,
+        shared across tests).
 
 pytest fixtures:
     epoch_id            — canonical test epoch ID string.
@@ -23,6 +25,8 @@ pytest fixtures:
 
 from __future__ import annotations
 
+import functools
+
 import pytest
 
 from aura_protocol.state_machine import EpochState, EpochStateMachine
@@ -33,11 +37,16 @@ from fixtures.fixture_loader import ProtocolFixture
 
 
 # ─── Protocol Fixture Singleton ───────────────────────────────────────────────
-# Loaded once at module import time; shared across all test modules.
-# Use the pytest fixture `protocol_fixture` for injection, or import
-# _PROTOCOL_FIXTURE directly in parametrize decorators (module-level eval).
+# Loaded on first use, so runs that never touch protocol.yaml skip the parse;
+# shared across all test modules afterwards. Use the pytest fixture
+# `protocol_fixture` for injection, or call _get_protocol_fixture() directly
+# in parametrize decorators (module-level eval).
+
 
-_PROTOCOL_FIXTURE = ProtocolFixture()
+@functools.cache
+def _get_protocol_fixture() -> ProtocolFixture:
+    """Return the ProtocolFixture singleton, loading protocol.yaml on first call."""
+    return ProtocolFixture()
 
 
 # ─── Module-Level Helpers ─────────────────────────────────────────────────────
@@ -68,6 +77,15 @@ _FORWARD_PHASES: list[PhaseId] = [
     PhaseId.P12_Landing,
     PhaseId.Complete,
 ]
+_FORWARD_PHASE_IDX: dict[PhaseId, int] = {p: i for i, p in enumerate(_FORWARD_PHASES)}
+
+
+def _record_full_accept(sm: EpochStateMachine) -> None:
+    """Record an ACCEPT vote on all three review axes (consensus gate)."""
+    record_vote = sm.record_vote
+    record_vote(ReviewAxis.Correctness, VoteType.Accept)
+    record_vote(ReviewAxis.TestQuality, VoteType.Accept)
+    record_vote(ReviewAxis.Elegance, VoteType.Accept)
 
 
 def _advance_to(sm: EpochStateMachine, target: PhaseId) -> None:
@@ -82,8 +100,8 @@ def _advance_to(sm: EpochStateMachine, target: PhaseId) -> None:
         sm: The state machine to advance. Must be at a phase earlier than target.
         target: The phase to stop at (inclusive — the machine will be AT target).
     """
-    current_idx = _FORWARD_PHASES.index(sm.state.current_phase)
-    target_idx = _FORWARD_PHASES.index(target)
+    current_idx = _FORWARD_PHASE_IDX[sm.state.current_phase]
+    target_idx = _FORWARD_PHASE_IDX[target]
 
     for i in range(current_idx, target_idx):
         frm = _FORWARD_PHASES[i]
@@ -91,15 +109,11 @@ def _advance_to(sm: EpochStateMachine, target: PhaseId) -> None:
 
         # Populate consensus gate before P4→P5 (plan review).
         if frm == PhaseId.P4_Review and nxt == PhaseId.P5_Uat:
-            sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-            sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-            sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+            _record_full_accept(sm)
 
         # Populate consensus + blocker-clear gate before P10→P11 (code review).
         if frm == PhaseId.P10_CodeReview and nxt == PhaseId.P11_ImplUat:
-            sm.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-            sm.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-            sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+            _record_full_accept(sm)
 
         sm.advance(nxt, triggered_by="test", condition_met="test-condition")
 
@@ -126,8 +140,9 @@ def _make_state(
 # ─── pytest Fixtures ──────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def epoch_id() -> str:
+    # Immutable literal, so one instance is safely shared by every test.
     return "test-epoch-001"
 
 
@@ -148,18 +163,16 @@ def sm_at_p4(sm: EpochStateMachine) -> EpochStateMachine:
 @pytest.fixture
 def sm_at_p4_with_consensus(sm_at_p4: EpochStateMachine) -> EpochStateMachine:
     """State machine at P4 with all 3 ACCEPT votes."""
-    sm_at_p4.record_vote(ReviewAxis.Correctness, VoteType.Accept)
-    sm_at_p4.record_vote(ReviewAxis.TestQuality, VoteType.Accept)
-    sm_at_p4.record_vote(ReviewAxis.Elegance, VoteType.Accept)
+    _record_full_accept(sm_at_p4)
     return sm_at_p4
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def protocol_fixture() -> ProtocolFixture:
-    """Return the module-level ProtocolFixture singleton.
+    """Return the ProtocolFixture singleton.
 
-    Loads protocol.yaml once at import time; this fixture just provides
-    the singleton via pytest injection for tests that prefer injection
-    over direct import.
+    protocol.yaml is loaded on first use; this fixture just provides the
+    singleton via pytest injection for tests that prefer injection over
+    direct import.
     """
-    return _PROTOCOL_FIXTURE
+    return _get_protocol_fixture()
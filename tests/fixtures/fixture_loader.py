@@ -28,6 +28,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -44,11 +45,25 @@ from aura_protocol.types import (
     VoteType,
 )
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# String value → enum member, so YAML rows resolve with one dict lookup
+# instead of going through EnumType.__call__.
+_PHASE: dict[str, PhaseId] = {p.value: p for p in PhaseId}
+_ROLE: dict[str, RoleId] = {r.value: r for r in RoleId}
+_VOTE: dict[str, VoteType] = {v.value: v for v in VoteType}
+_AXIS: dict[str, ReviewAxis] = {a.value: a for a in ReviewAxis}
+_EVENT: dict[str, EventType] = {e.value: e for e in EventType}
+
 
 # ─── TestCase Dataclasses ─────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionTestCase:
     """Generated test case for phase transitions.
 
@@ -71,7 +86,7 @@ class TransitionTestCase:
     id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteTestCase:
     """Generated test case for vote combinations in review phases.
 
@@ -94,7 +109,7 @@ class VoteTestCase:
     id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEventTestCase:
     """Generated test case for audit event recording.
 
@@ -113,7 +128,7 @@ class AuditEventTestCase:
     id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstraintViolationTestCase:
     """Generated test case for runtime constraint violation checks.
 
@@ -185,41 +200,41 @@ class ProtocolFixture:
         self._path = Path(fixture_path)
 
         with open(self._path) as f:
-            self._data: dict = yaml.safe_load(f)
+            self._data: dict = yaml.load(f, Loader=_Loader)
 
     # ─── Axis Properties ──────────────────────────────────────────────────────
 
-    @property
+    @cached_property
     def phase_specs(self) -> dict:
         """Raw phase_specs axis from YAML (keyed by spec name)."""
         return self._data.get("phase_specs", {})
 
-    @property
+    @cached_property
     def epoch_states(self) -> dict:
         """Raw epoch_states axis from YAML (keyed by state name)."""
         return self._data.get("epoch_states", {})
 
-    @property
+    @cached_property
     def vote_combinations(self) -> dict:
         """Raw vote_combinations axis from YAML (keyed by combo name)."""
         return self._data.get("vote_combinations", {})
 
-    @property
+    @cached_property
     def audit_events(self) -> dict:
         """Raw audit_events axis from YAML (keyed by event name)."""
         return self._data.get("audit_events", {})
 
-    @property
+    @cached_property
     def forward_phase_path(self) -> list[str]:
         """Ordered list of phase_id strings for the forward (happy) path."""
         return self._data.get("forward_phase_path", [])
 
-    @property
+    @cached_property
     def transition_matrix(self) -> dict:
         """Predefined transition expectation matrix from YAML."""
         return self._data.get("transition_matrix", {})
 
-    @property
+    @cached_property
     def constraint_violations(self) -> dict:
         """Raw constraint_violations axis from YAML (keyed by constraint_id).
 
@@ -229,9 +244,64 @@ class ProtocolFixture:
         """
         return self._data.get("constraint_violations", {})
 
-    # ─── Generators ───────────────────────────────────────────────────────────
+    # ─── Cached Cases ─────────────────────────────────────────────────────────
+    # Each generator's output is materialized once per fixture instance, like
+    # the axis properties above, and every generate_*() call replays the same
+    # objects. The tuple is immutable but its cases are not deeply frozen: they
+    # hold mutable EpochState objects, dicts (votes, violation_args) and
+    # AuditEvent payloads shared by every caller. Callers must not mutate
+    # cached cases; copy a case's state before changing it.
+
+    @cached_property
+    def transition_test_cases(self) -> tuple[TransitionTestCase, ...]:
+        """All cases from generate_transition_test_cases(), materialized once."""
+        return tuple(self._iter_transition_test_cases())
+
+    @cached_property
+    def forward_path_transition_cases(self) -> tuple[TransitionTestCase, ...]:
+        """All cases from generate_forward_path_transition_cases(), materialized once."""
+        return tuple(self._iter_forward_path_transition_cases())
+
+    @cached_property
+    def vote_test_cases(self) -> tuple[VoteTestCase, ...]:
+        """All cases from generate_vote_test_cases(), materialized once."""
+        return tuple(self._iter_vote_test_cases())
+
+    @cached_property
+    def audit_event_test_cases(self) -> tuple[AuditEventTestCase, ...]:
+        """All cases from generate_audit_event_test_cases(), materialized once."""
+        return tuple(self._iter_audit_event_test_cases())
+
+    @cached_property
+    def constraint_violation_test_cases(self) -> tuple[ConstraintViolationTestCase, ...]:
+        """All cases from generate_constraint_violation_test_cases(), materialized once."""
+        return tuple(self._iter_constraint_violation_test_cases())
 
     def generate_transition_test_cases(self) -> Iterator[TransitionTestCase]:
+        """Iterate transition_test_cases (see _iter_transition_test_cases)."""
+        return iter(self.transition_test_cases)
+
+    def generate_forward_path_transition_cases(self) -> Iterator[TransitionTestCase]:
+        """Iterate forward_path_transition_cases (see _iter_forward_path_transition_cases)."""
+        return iter(self.forward_path_transition_cases)
+
+    def generate_vote_test_cases(self) -> Iterator[VoteTestCase]:
+        """Iterate vote_test_cases (see _iter_vote_test_cases)."""
+        return iter(self.vote_test_cases)
+
+    def generate_audit_event_test_cases(self) -> Iterator[AuditEventTestCase]:
+        """Iterate audit_event_test_cases (see _iter_audit_event_test_cases)."""
+        return iter(self.audit_event_test_cases)
+
+    def generate_constraint_violation_test_cases(
+        self,
+    ) -> Iterator[ConstraintViolationTestCase]:
+        """Iterate constraint_violation_test_cases (see _iter_constraint_violation_test_cases)."""
+        return iter(self.constraint_violation_test_cases)
+
+    # ─── Generators ───────────────────────────────────────────────────────────
+
+    def _iter_transition_test_cases(self) -> Iterator[TransitionTestCase]:
         """Generate transition test cases from the transition_matrix axis.
 
         Yields one TransitionTestCase per matrix entry in:
@@ -264,7 +334,7 @@ class ProtocolFixture:
                     id=f"{category}:{source}->{target}",
                 )
 
-    def generate_forward_path_transition_cases(self) -> Iterator[TransitionTestCase]:
+    def _iter_forward_path_transition_cases(self) -> Iterator[TransitionTestCase]:
         """Generate test cases for every consecutive pair in the forward path.
 
         Uses forward_phase_path to enumerate p1→p2, p2→p3, ..., p12→complete.
@@ -291,7 +361,7 @@ class ProtocolFixture:
                 id=f"forward:{source}->{target}",
             )
 
-    def generate_vote_test_cases(self) -> Iterator[VoteTestCase]:
+    def _iter_vote_test_cases(self) -> Iterator[VoteTestCase]:
         """Generate vote test cases by crossing vote_combinations × review phases.
 
         Review phases: p4 (plan review) and p10 (code review).
@@ -320,7 +390,7 @@ class ProtocolFixture:
                     id=f"{phase}:{combo_name}",
                 )
 
-    def generate_audit_event_test_cases(self) -> Iterator[AuditEventTestCase]:
+    def _iter_audit_event_test_cases(self) -> Iterator[AuditEventTestCase]:
         """Generate audit event test cases from the audit_events axis.
 
         Constructs real AuditEvent objects from YAML definitions.
@@ -337,12 +407,12 @@ class ProtocolFixture:
             description = event_def.get("description", event_name)
 
             # Map string values to enums
-            phase = PhaseId(phase_str)
-            role = RoleId(role_str)
+            phase = _PHASE[phase_str]
+            role = _ROLE[role_str]
 
             event = AuditEvent(
                 epoch_id=epoch_id,
-                event_type=EventType(event_type),
+                event_type=_EVENT[event_type],
                 phase=phase,
                 role=role,
                 payload=payload,
@@ -351,12 +421,12 @@ class ProtocolFixture:
             yield AuditEventTestCase(
                 event_name=event_name,
                 event=event,
-                event_type=EventType(event_type),
+                event_type=_EVENT[event_type],
                 description=description,
                 id=f"audit:{event_name}",
             )
 
-    def generate_constraint_violation_test_cases(
+    def _iter_constraint_violation_test_cases(
         self,
     ) -> Iterator[ConstraintViolationTestCase]:
         """Generate constraint violation test cases from the constraint_violations axis.
@@ -408,7 +478,7 @@ class ProtocolFixture:
                 raw_args = dict(entry.get("violation_args", {}))
                 # Single coercion: "phase" string → PhaseId enum
                 if "phase" in raw_args and isinstance(raw_args["phase"], str):
-                    raw_args["phase"] = PhaseId(raw_args["phase"])
+                    raw_args["phase"] = _PHASE[raw_args["phase"]]
                 yield ConstraintViolationTestCase(
                     constraint_id=constraint_id,
                     description=description,
@@ -425,8 +495,8 @@ class ProtocolFixture:
             # Transition-based check (e.g. C-handoff-skill-invocation)
             if "violation_transition" in entry:
                 vt = entry["violation_transition"]
-                from_phase = PhaseId(vt["from_phase"])
-                to_phase = PhaseId(vt["to_phase"])
+                from_phase = _PHASE[vt["from_phase"]]
+                to_phase = _PHASE[vt["to_phase"]]
                 yield ConstraintViolationTestCase(
                     constraint_id=constraint_id,
                     description=description,
@@ -443,10 +513,10 @@ class ProtocolFixture:
             # State-based check: build EpochState from violation_state dict
             vs = entry.get("violation_state", {})
             phase_str = vs.get("current_phase", "p1")
-            current_phase = PhaseId(phase_str)
+            current_phase = _PHASE[phase_str]
 
             raw_votes: dict[str, str] = vs.get("review_votes", {})
-            review_votes = {k: VoteType(v) for k, v in raw_votes.items()}
+            review_votes = {k: _VOTE[v] for k, v in raw_votes.items()}
 
             blocker_count: int = vs.get("blocker_count", 0)
 
@@ -461,8 +531,8 @@ class ProtocolFixture:
             transition_history: list[TransitionRecord] = []
             for raw_record in vs.get("transition_history", []):
                 transition_history.append(TransitionRecord(
-                    from_phase=PhaseId(raw_record["from_phase"]),
-                    to_phase=PhaseId(raw_record["to_phase"]),
+                    from_phase=_PHASE[raw_record["from_phase"]],
+                    to_phase=_PHASE[raw_record["to_phase"]],
                     triggered_by=raw_record.get("triggered_by", ""),
                     condition_met=raw_record.get("condition_met", ""),
                     timestamp=datetime.now(tz=timezone.utc),
@@ -504,6 +574,6 @@ class ProtocolFixture:
         combo = self.vote_combinations[combo_name]
         raw_votes: dict[str, str] = combo.get("votes", {})
         return {
-            ReviewAxis(axis): VoteType(vote)
+            _AXIS[axis]: _VOTE[vote]
             for axis, vote in raw_votes.items()
         }
@@ -234,6 +234,15 @@ STRUCTURAL_MUTATIONS: list[SchemaMutation] = [
         category="skill_invocation",
         apply_fn=_del_attr(".//skill-invocation", "directive"),
     ),
+    # ── Duplicate IDs ──
+    SchemaMutation(
+        name="duplicate_substep_id",
+        layer=ErrorLayer.STRUCTURAL,
+        description="Substep in a second phase reuses an existing substep id",
+        expected_fragment="duplicate substep id 's1' (first seen on phase[@id='p1']/substep[@id='s1'])",
+        category="substep",
+        apply_fn=_set_attr(".//substep[@id='s2']", "id", "s1"),
+    ),
 ]
 
 # ─── Referential integrity mutations ─────────────────────────────────────────
@@ -0,0 +1,404 @@
+"""Tests for scripts/import_jsonl_to_dolt.py.
+
+Covers the functions that run without a Dolt server:
+- TestIterIssues: chunked JSONL reading (chunk boundaries, CRLF, blank lines,
+  missing trailing newline)
+- TestTsvField: LOAD DATA field escaping round-trips
+- TestIssueRows: per-table row construction and defaults
+- TestDryRunCounts: dry-run counting, with no files written
+- TestLoadDataRows / TestLoadIssuesFallback: LOAD DATA fallback decisions,
+  against a fake cursor
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pymysql")
+
+import import_jsonl_to_dolt
+from import_jsonl_to_dolt import (
+    ISSUE_COLUMNS,
+    TABLES,
+    _tsv_field,
+    dry_run_counts,
+    issue_rows,
+    iter_issues,
+    load_data_rows,
+    load_issues,
+)
+
+
+def _write_jsonl(path: Path, issues: list[dict], *, sep: str = "\n", trailing: bool = True) -> Path:
+    text = sep.join(json.dumps(issue) for issue in issues)
+    path.write_bytes((text + sep if trailing else text).encode())
+    return path
+
+
+ISSUES = [
+    {"id": "aura-1", "title": "first", "labels": ["a", "b"]},
+    {"id": "aura-2", "title": "second — ünïcode", "description": "x" * 50},
+    {"id": "aura-3", "title": "third", "comments": [{"id": 1, "issue_id": "aura-3"}]},
+]
+
+
+class TestIterIssues:
+    """iter_issues yields one dict per non-blank line, whatever the chunking."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 1 << 20])
+    def test_lines_spanning_chunk_boundaries(self, tmp_path, monkeypatch, chunk_size) -> None:
+        monkeypatch.setattr(import_jsonl_to_dolt, "READ_CHUNK_SIZE", chunk_size)
+        path = _write_jsonl(tmp_path / "issues.jsonl", ISSUES)
+
+        assert list(iter_issues(path)) == ISSUES
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+    def test_crlf_line_endings(self, tmp_path, monkeypatch, chunk_size) -> None:
+        monkeypatch.setattr(import_jsonl_to_dolt, "READ_CHUNK_SIZE", chunk_size)
+        path = _write_jsonl(tmp_path / "issues.jsonl", ISSUES, sep="\r\n")
+
+        assert list(iter_issues(path)) == ISSUES
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+    def test_blank_and_whitespace_lines_are_skipped(self, tmp_path, monkeypatch, chunk_size) -> None:
+        monkeypatch.setattr(import_jsonl_to_dolt, "READ_CHUNK_SIZE", chunk_size)
+        path = tmp_path / "issues.jsonl"
+        lines = ["", json.dumps(ISSUES[0]), "   ", "", json.dumps(ISSUES[1]), "\t", ""]
+        path.write_text("\n".join(lines) + "\n\n")
+
+        assert list(iter_issues(path)) == ISSUES[:2]
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+    def test_missing_trailing_newline(self, tmp_path, monkeypatch, chunk_size) -> None:
+        monkeypatch.setattr(import_jsonl_to_dolt, "READ_CHUNK_SIZE", chunk_size)
+        path = _write_jsonl(tmp_path / "issues.jsonl", ISSUES, trailing=False)
+
+        assert list(iter_issues(path)) == ISSUES
+
+    def test_empty_file_yields_nothing(self, tmp_path) -> None:
+        path = tmp_path / "issues.jsonl"
+        path.write_bytes(b"")
+
+        assert list(iter_issues(path)) == []
+
+    def test_invalid_json_line_raises(self, tmp_path) -> None:
+        path = tmp_path / "issues.jsonl"
+        path.write_text(json.dumps(ISSUES[0]) + "\n{not json\n")
+
+        issues = iter_issues(path)
+        assert next(issues) == ISSUES[0]
+        with pytest.raises(ValueError):
+            next(issues)
+
+
+# ─── LOAD DATA encoding ───────────────────────────────────────────────────────
+
+_TSV_UNESCAPE = {"0": "\0", "t": "\t", "n": "\n", "r": "\r", "\\": "\\"}
+
+
+def _tsv_decode(field: bytes) -> str | None:
+    """Decode one field the way LOAD DATA's default FIELDS ESCAPED BY '\\' does."""
+    if field == b"\\N":
+        return None
+    return re.sub(r"\\(.)", lambda m: _TSV_UNESCAPE[m.group(1)], field.decode(), flags=re.S)
+
+
+class TestTsvField:
+    """_tsv_field escapes values so LOAD DATA reads them back unchanged."""
+
+    def test_none_is_null_marker(self) -> None:
+        assert _tsv_field(None) == b"\\N"
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "plain",
+            "back\\slash",
+            "tab\there",
+            "new\nline",
+            "carriage\rreturn",
+            "nul\0byte",
+            "\\N",
+            "\\\t\n\r\0 mixed \\\\",
+            "ünïcode — ok",
+            "",
+        ],
+    )
+    def test_special_characters_round_trip(self, value) -> None:
+        field = _tsv_field(value)
+
+        assert not re.search(rb"[\t\n\r\0]", field)
+        assert _tsv_decode(field) == value
+
+    def test_non_string_values_use_str(self) -> None:
+        assert _tsv_decode(_tsv_field(3)) == "3"
+
+
+# ─── Row construction ─────────────────────────────────────────────────────────
+
+
+class TestIssueRows:
+    """issue_rows builds one row per table, in TABLES column order."""
+
+    def test_minimal_issue_gets_defaults(self) -> None:
+        issue_row, label_rows, dep_rows, comment_rows = issue_rows({"id": "aura-1"})
+
+        assert dict(zip(ISSUE_COLUMNS, issue_row)) == {
+            "id": "aura-1",
+            "title": "",
+            "description": "",
+            "design": "",
+            "acceptance_criteria": "",
+            "notes": "",
+            "status": "open",
+            "priority": 2,
+            "issue_type": "task",
+            "owner": None,
+            "assignee": None,
+            "created_at": "",
+            "created_by": None,
+            "updated_at": "",
+            "closed_at": None,
+            "close_reason": None,
+        }
+        assert (label_rows, dep_rows, comment_rows) == ([], [], [])
+
+    def test_empty_optional_strings_become_null(self) -> None:
+        issue_row, *_ = issue_rows({"id": "aura-1", "owner": "", "closed_at": ""})
+        row = dict(zip(ISSUE_COLUMNS, issue_row))
+
+        assert row["owner"] is None
+        assert row["closed_at"] is None
+
+    def test_child_rows(self) -> None:
+        issue = {
+            "id": "aura-1",
+            "labels": ["p1", "bug"],
+            "dependencies": [
+                {"issue_id": "aura-1", "depends_on_id": "aura-0"},
+                {
+                    "issue_id": "aura-1",
+                    "depends_on_id": "aura-2",
+                    "type": "parent-child",
+                    "created_at": "2026-01-01",
+                    "created_by": "me",
+                    "metadata": {"note": "ünï", "n": 1},
+                },
+                {"issue_id": "aura-1", "depends_on_id": "aura-3", "metadata": {}},
+                {"issue_id": "aura-1", "depends_on_id": "aura-4", "metadata": '{"raw":true}'},
+            ],
+            "comments": [{"id": 7, "issue_id": "aura-1", "text": "hi"}],
+        }
+
+        _, label_rows, dep_rows, comment_rows = issue_rows(issue)
+
+        assert label_rows == [("aura-1", "p1"), ("aura-1", "bug")]
+        assert dep_rows == [
+            ("aura-1", "aura-0", "blocks", "", None, "{}"),
+            ("aura-1", "aura-2", "parent-child", "2026-01-01", "me", '{"note":"ünï","n":1}'),
+            ("aura-1", "aura-3", "blocks", "", None, "{}"),
+            ("aura-1", "aura-4", "blocks", "", None, '{"raw":true}'),
+        ]
+        assert comment_rows == [(7, "aura-1", "", "hi", "")]
+
+    def test_row_widths_match_table_columns(self) -> None:
+        rows = issue_rows(
+            {
+                "id": "aura-1",
+                "labels": ["x"],
+                "dependencies": [{"issue_id": "aura-1", "depends_on_id": "aura-0"}],
+                "comments": [{"id": 1, "issue_id": "aura-1"}],
+            }
+        )
+        issue_row, *child_rows = rows
+        widths = [len(issue_row)] + [len(table_rows[0]) for table_rows in child_rows]
+
+        assert widths == [sql.count("%s") for _, sql, _, _ in TABLES]
+
+    def test_missing_id_raises(self) -> None:
+        with pytest.raises(KeyError):
+            issue_rows({"title": "no id"})
+
+
+class TestDryRunCounts:
+    """dry_run_counts counts rows per table and leaves the directory untouched."""
+
+    def test_counts_child_rows(self, tmp_path) -> None:
+        path = _write_jsonl(
+            tmp_path / "issues.jsonl",
+            [
+                {"id": "a", "labels": ["x", "y"], "dependencies": [{}], "comments": [{}, {}, {}]},
+                {"id": "b"},
+            ],
+        )
+
+        assert dry_run_counts(path) == {"issues": 2, "labels": 2, "dependencies": 1, "comments": 3}
+        assert [p.name for p in tmp_path.iterdir()] == ["issues.jsonl"]
+
+    def test_empty_file(self, tmp_path) -> None:
+        path = tmp_path / "issues.jsonl"
+        path.write_bytes(b"\n")
+
+        assert dry_run_counts(path) == {"issues": 0, "labels": 0, "dependencies": 0, "comments": 0}
+
+
+# ─── LOAD DATA fallback (fake cursor) ─────────────────────────────────────────
+
+
+class _FakeCursor:
+    """Records statements; LOAD DATA reports `loaded` rows and `warnings`."""
+
+    def __init__(self, *, loaded: int | None = None, warnings: int = 0, load_error=None) -> None:
+        self.statements: list[str] = []
+        self.loaded = loaded
+        self.warnings = warnings
+        self.load_error = load_error
+        self.warning_count = 0
+
+    def execute(self, sql, args=None):
+        self.statements.append(sql.split(" (")[0] if sql.startswith("INSERT") else sql)
+        self.warning_count = 0
+        if sql.startswith("LOAD DATA"):
+            if self.load_error is not None:
+                raise self.load_error
+            self.warning_count = self.warnings
+            return self.loaded
+        return 1
+
+    def executemany(self, sql, rows):
+        self.statements.append("INSERT MANY")
+        return len(rows)
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.committed = self.rolled_back = False
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+
+ROWS = [("a", "x"), ("b", "y")]
+
+
+class TestLoadDataRows:
+    """load_data_rows reports False (and rolls back) unless the load was clean."""
+
+    def test_clean_load(self) -> None:
+        cur = _FakeCursor(loaded=2)
+
+        assert load_data_rows(cur, "labels", ("issue_id", "label"), ROWS) is True
+        assert "ROLLBACK TO SAVEPOINT load_data" not in cur.statements
+
+    def test_short_row_count_rolls_back(self) -> None:
+        cur = _FakeCursor(loaded=1, warnings=1)
+
+        assert load_data_rows(cur, "labels", ("issue_id", "label"), ROWS) is False
+        assert cur.statements[-1] == "ROLLBACK TO SAVEPOINT load_data"
+
+    def test_conversion_warnings_roll_back(self) -> None:
+        # Every row loaded, but with coerced values.
+        cur = _FakeCursor(loaded=2, warnings=2)
+
+        assert load_data_rows(cur, "labels", ("issue_id", "label"), ROWS) is False
+        assert cur.statements[-1] == "ROLLBACK TO SAVEPOINT load_data"
+
+    def test_statement_error_rolls_back_and_raises(self) -> None:
+        import pymysql
+
+        cur = _FakeCursor(load_error=pymysql.err.OperationalError(1148, "not allowed"))
+
+        with pytest.raises(pymysql.err.OperationalError):
+            load_data_rows(cur, "labels", ("issue_id", "label"), ROWS)
+        assert cur.statements[-1] == "ROLLBACK TO SAVEPOINT load_data"
+
+
+class TestLoadIssuesFallback:
+    """load_issues only abandons LOAD DATA when the server refuses it."""
+
+    def test_refused_load_data_falls_back_to_inserts(self) -> None:
+        import pymysql
+
+        cur = _FakeCursor(load_error=pymysql.err.OperationalError(3948, "local infile disabled"))
+        conn = _FakeConn()
+
+        n_issues, errors = load_issues(conn, cur, [{"id": "aura-1"}])
+
+        assert (n_issues, errors) == (1, [])
+        assert conn.committed
+        assert cur.statements.count("INSERT MANY") == 1
+
+    def test_other_load_data_errors_abort_the_load(self) -> None:
+        import pymysql
+
+        cur = _FakeCursor(load_error=pymysql.err.OperationalError(2013, "lost connection"))
+        conn = _FakeConn()
+
+        with pytest.raises(pymysql.err.OperationalError):
+            load_issues(conn, cur, [{"id": "aura-1"}])
+        assert conn.rolled_back and not conn.committed
+
+    def test_checks_restored_after_failed_load(self) -> None:
+        import pymysql
+
+        cur = _FakeCursor(load_error=pymysql.err.OperationalError(2013, "lost connection"))
+
+        with pytest.raises(pymysql.err.OperationalError):
+            load_issues(_FakeConn(), cur, [{"id": "aura-1"}])
+        assert cur.statements[-2:] == ["SET FOREIGN_KEY_CHECKS=1", "SET UNIQUE_CHECKS=1"]
+
+    def test_failed_rollback_keeps_original_error(self, capsys) -> None:
+        import pymysql
+
+        class _BrokenConn(_FakeConn):
+            def rollback(self) -> None:
+                raise pymysql.err.InterfaceError(0, "connection closed")
+
+        cur = _FakeCursor(load_error=pymysql.err.OperationalError(2013, "lost connection"))
+
+        with pytest.raises(pymysql.err.OperationalError):
+            load_issues(_BrokenConn(), cur, [{"id": "aura-1"}])
+        assert cur.statements[-2:] == ["SET FOREIGN_KEY_CHECKS=1", "SET UNIQUE_CHECKS=1"]
+        assert "rollback failed" in capsys.readouterr().err
+
+    def test_writer_failures_reported_from_main_thread(self, monkeypatch) -> None:
+        import pymysql
+
+        class _RejectingCursor(_FakeCursor):
+            # Every INSERT touching aura-2 fails, so its row is retried alone
+            # and reported.
+            def executemany(self, sql, rows):
+                if any("aura-2" in row for row in rows):
+                    raise pymysql.err.IntegrityError(1062, "duplicate")
+                return super().executemany(sql, rows)
+
+            def execute(self, sql, args=None):
+                if args is not None and "aura-2" in args:
+                    raise pymysql.err.IntegrityError(1062, "duplicate")
+                return super().execute(sql, args)
+
+        class _ThreadRecorder(io.StringIO):
+            def write(self, text: str) -> int:
+                threads.add(threading.current_thread())
+                return super().write(text)
+
+        threads: set[threading.Thread] = set()
+        monkeypatch.setattr(import_jsonl_to_dolt, "BATCH_SIZE", 1)
+        monkeypatch.setattr("sys.stderr", _ThreadRecorder())
+        cur = _RejectingCursor(load_error=pymysql.err.OperationalError(3948, "disabled"))
+        issues = [{"id": f"aura-{n}"} for n in range(1, 5)]
+
+        n_issues, errors = load_issues(_FakeConn(), cur, issues)
+
+        assert n_issues == 4
+        assert errors == [("aura-2", "(1062, 'duplicate')")]
+        assert threads == {threading.main_thread()}
@@ -43,9 +43,9 @@ from aura_protocol.types import (
     VoteType,
 )
 
-# Module-level import of singleton: evaluated once at collection time.
+# Module-level access to the singleton: evaluated once at collection time.
 # This is the same pattern used in test_patterns_combinatorial.py in agentfilter.
-from conftest import _PROTOCOL_FIXTURE, _advance_to
+from conftest import _advance_to, _get_protocol_fixture
 from fixtures.fixture_loader import (
     AuditEventTestCase,
     ConstraintViolationTestCase,
@@ -57,6 +57,8 @@ from fixtures.fixture_loader import (
 
 # ─── Module-level case generation (for parametrize decorators) ─────────────────
 
+_PROTOCOL_FIXTURE = _get_protocol_fixture()
+
 _TRANSITION_CASES = list(_PROTOCOL_FIXTURE.generate_transition_test_cases())
 _FORWARD_PATH_CASES = list(_PROTOCOL_FIXTURE.generate_forward_path_transition_cases())
 _VOTE_CASES = list(_PROTOCOL_FIXTURE.generate_vote_test_cases())
@@ -204,6 +206,13 @@ class TestFixtureLoaderGenerators:
         runnable = [tc for tc in _CONSTRAINT_CASES if tc.skip_reason is None]
         assert len(runnable) == 27
 
+    def test_generators_replay_cached_cases(self) -> None:
+        """Repeated generator calls yield the same materialized case objects."""
+        again = list(_PROTOCOL_FIXTURE.generate_transition_test_cases())
+        assert again == _TRANSITION_CASES
+        assert all(a is b for a, b in zip(again, _TRANSITION_CASES))
+        assert tuple(again) == _PROTOCOL_FIXTURE.transition_test_cases
+
     def test_build_vote_dict_all_accept(self) -> None:
         """build_vote_dict('all_accept') returns typed ReviewAxis → VoteType dict."""
         votes = _PROTOCOL_FIXTURE.build_vote_dict("all_accept")
@@ -481,6 +481,26 @@ class TestVoteRecording:
         sm.record_vote(ReviewAxis.Elegance, VoteType.Accept)
         assert len(sm.state.review_votes) == 3
 
+    def test_record_votes_batch_matches_sequential(self) -> None:
+        sm = _make_sm()
+        sm.record_votes(
+            [
+                (ReviewAxis.Correctness, VoteType.Revise),
+                (ReviewAxis.TestQuality, VoteType.Accept),
+                (ReviewAxis.Correctness, VoteType.Accept),
+            ]
+        )
+        assert sm.state.review_votes == {
+            ReviewAxis.Correctness: VoteType.Accept,
+            ReviewAxis.TestQuality: VoteType.Accept,
+        }
+
+    def test_record_votes_invalid_axis_records_nothing(self) -> None:
+        sm = _make_sm()
+        with pytest.raises(ValueError):
+            sm.record_votes([(ReviewAxis.Correctness, VoteType.Accept), ("X", VoteType.Accept)])
+        assert sm.state.review_votes == {}
+
     def test_has_consensus_false_with_no_votes(self) -> None:
         sm = _make_sm()
         assert sm.has_consensus() is False
@@ -20,7 +20,15 @@ from pathlib import Path
 
 import pytest
 
-from validate_schema import ErrorLayer, ValidationError, validate, validate_tree
+from validate_schema import (
+    ErrorLayer,
+    ValidationError,
+    _validate_file,
+    build_index,
+    check_refs,
+    validate,
+    validate_tree,
+)
 
 from fixtures.schema_fixture import (
     ALL_MUTATIONS,
@@ -99,6 +107,56 @@ class TestValidSchemas:
             )
 
 
+class TestValidateCache:
+    """validate(path) caches by file identity and revalidates on change."""
+
+    def test_unchanged_file_hits_cache(self, tmp_path: Path):
+        path = tmp_path / "schema.xml"
+        path.write_bytes(FIXTURE_PATH.read_bytes())
+        assert validate(path) == []
+        hits = _validate_file.cache_info().hits
+        assert validate(path) == []
+        assert _validate_file.cache_info().hits == hits + 1
+
+    def test_path_aliases_share_an_entry(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "schema.xml"
+        path.write_bytes(FIXTURE_PATH.read_bytes())
+        assert validate(path) == []
+        hits = _validate_file.cache_info().hits
+        monkeypatch.chdir(tmp_path)
+        assert validate(Path("schema.xml")) == []
+        assert validate(tmp_path / "." / "schema.xml") == []
+        assert _validate_file.cache_info().hits == hits + 2
+
+    def test_rewritten_file_is_revalidated(
+        self, tmp_path: Path, schema_fixture: SchemaFixture
+    ):
+        path = tmp_path / "schema.xml"
+        path.write_bytes(FIXTURE_PATH.read_bytes())
+        assert validate(path) == []
+
+        root = schema_fixture.apply_mutation(STRUCTURAL_MUTATIONS[0])
+        ET.ElementTree(root).write(str(path), xml_declaration=True, encoding="unicode")
+        assert any(e.layer == ErrorLayer.STRUCTURAL for e in validate(path))
+
+
+class TestCheckRefs:
+    """check_refs keeps its entity-ref memo local to the call."""
+
+    def test_index_is_not_mutated(self, schema_fixture: SchemaFixture):
+        root = schema_fixture.fresh_root()
+        root.find(".//document/covers/entity").set("refs", "p1,p-missing")
+        index, _ = build_index(root)
+        before = dict(vars(index))
+
+        first = check_refs(root, index)
+        second = check_refs(root, index)
+
+        assert [e.message for e in first] == [e.message for e in second]
+        assert any("p-missing" in e.message for e in first)
+        assert vars(index) == before
+
+
 # ─── Mutation detection (parametrized) ───────────────────────────────────────
 
 
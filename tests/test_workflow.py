@@ -37,8 +37,10 @@ import asyncio
 import functools
 import inspect
 import os
+from collections import deque
 from dataclasses import fields
 from datetime import timedelta
+from types import SimpleNamespace
 
 import pytest
 import pytest_asyncio
@@ -50,7 +52,7 @@ from aura_protocol.state_machine import (
     TransitionError,
     TransitionRecord,
 )
-from aura_protocol.types import EventType, PhaseId, ReviewAxis, Transition, VoteType
+from aura_protocol.types import PHASE_DOMAIN, EventType, PhaseId, ReviewAxis, Transition, VoteType
 from aura_protocol.workflow import (
     SA_DOMAIN,
     SA_EPOCH_ID,
@@ -58,6 +60,7 @@ from aura_protocol.workflow import (
     SA_PHASE,
     SA_ROLE,
     SA_STATUS,
+    EpochCheckpoint,
     EpochInput,
     EpochResult,
     EpochWorkflow,
@@ -66,12 +69,14 @@ from aura_protocol.workflow import (
     ReviewPhaseResult,
     ReviewPhaseWorkflow,
     ReviewVoteSignal,
+    SessionRegisterSignal,
     SliceInput,
     SliceProgressSignal,
     SliceResult,
     SliceWorkflow,
     check_constraints,
     record_transition,
+    record_transition_batch,
 )
 from conftest import _advance_to
 from temporalio.common import SearchAttributeKey
@@ -82,7 +87,7 @@ from temporalio.testing import ActivityEnvironment
 # Centralized list of @activity.defn functions registered with Temporal workers
 # in sandbox tests. Extend here when new activity modules are added.
 
-_TEMPORAL_ACTIVITIES: list = [check_constraints, record_transition]
+_TEMPORAL_ACTIVITIES: list = [check_constraints, record_transition, record_transition_batch]
 
 try:
     from aura_protocol.audit_activities import (
@@ -95,6 +100,7 @@ try:
     _TEMPORAL_ACTIVITIES = [
         check_constraints,
         record_transition,
+        record_transition_batch,
         record_audit_event,
         query_audit_events,
     ]
@@ -167,6 +173,10 @@ class TestSignalQueryTypes:
         with pytest.raises((AttributeError, TypeError)):
             inp.epoch_id = "changed"  # type: ignore[misc]
 
+    def test_epoch_input_transition_persistence_off_by_default(self) -> None:
+        """record_transition is a v1 stub, so epochs opt in to running it."""
+        assert EpochInput(epoch_id="ep-1", request_description="r").persist_transitions is False
+
     def test_epoch_result_is_frozen_dataclass(self) -> None:
         """EpochResult must be a frozen dataclass with the correct fields."""
         result = EpochResult(
@@ -364,6 +374,34 @@ class TestRecordTransitionActivity:
             result = await env.run(record_transition, record)
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_record_transition_batch_logs_each_record_in_order(self, caplog) -> None:
+        """record_transition_batch records every transition in the batch, in order."""
+        from datetime import datetime, timezone
+
+        records = [
+            TransitionRecord(
+                from_phase=from_p,
+                to_phase=to_p,
+                timestamp=datetime.now(tz=timezone.utc),
+                triggered_by="supervisor",
+                condition_met="all conditions met",
+            )
+            for from_p, to_p in [
+                (PhaseId.P1_Request, PhaseId.P2_Elicit),
+                (PhaseId.P2_Elicit, PhaseId.P3_Propose),
+            ]
+        ]
+        env = ActivityEnvironment()
+        with caplog.at_level("INFO", logger="aura_protocol.workflow"):
+            result = await env.run(record_transition_batch, records)
+        assert result is None
+        logged = [r.getMessage() for r in caplog.records if "Transition recorded" in r.getMessage()]
+        assert logged == [
+            "Transition recorded: p1 -> p2 (triggered_by=supervisor)",
+            "Transition recorded: p2 -> p3 (triggered_by=supervisor)",
+        ]
+
 
 # ─── L3: AC6 / AC7 — State Machine Integration ───────────────────────────────
 # These tests verify the SAME deterministic logic that EpochWorkflow.run() uses.
@@ -561,6 +599,20 @@ class TestAC7QueryCurrentState:
         assert state.current_phase == PhaseId.P9_Slice
         assert state.current_phase.value == "p9"
 
+    def test_current_state_query_returns_detached_snapshot(self) -> None:
+        """current_state() mutations do not leak into the workflow's live state."""
+        wf = EpochWorkflow()
+        wf._sm = _make_sm("ac7-epoch-snapshot")
+        _advance_to(wf._sm, PhaseId.P3_Propose)
+
+        snapshot = wf.current_state()
+        assert snapshot == wf._sm.state
+        snapshot.transition_history.clear()
+        snapshot.completed_phases.clear()
+
+        assert len(wf._sm.state.transition_history) == 2
+        assert PhaseId.P1_Request in wf._sm.state.completed_phases
+
     def test_current_state_reflects_completed_phases(self) -> None:
         """AC7: current_state includes completed_phases — no stale phase info."""
         sm = _make_sm("ac7-epoch-3")
@@ -804,6 +856,26 @@ class TestFailedTransitionAuditTrailUnit:
         # Workflow still at P1 (all transitions were rejected).
         assert sm.state.current_phase == PhaseId.P1_Request
 
+    @pytest.mark.asyncio
+    async def test_apply_advance_counts_failed_attempts(self, monkeypatch) -> None:
+        """EpochWorkflow._apply_advance bumps _failed_count for rejected advances."""
+        from datetime import datetime, timezone
+
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.now",
+            lambda: datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        wf = EpochWorkflow()
+        wf._sm = _make_sm("audit-trail-epoch-4")
+        await wf._apply_advance(
+            "audit-trail-epoch-4",
+            PhaseAdvanceSignal(to_phase=PhaseId.P9_Slice, triggered_by="architect", condition_met="invalid"),
+        )
+
+        assert wf._failed_count == 1
+        assert wf._successful_count == 0
+        assert wf._failed_count + wf._successful_count == len(wf._sm.state.transition_history)
+
 
 # ─── Full Lifecycle Integration ────────────────────────────────────────────────
 
@@ -1503,6 +1575,26 @@ class TestSliceWorkflowTypes:
         """SliceWorkflow.run must be decorated with @workflow.run."""
         assert hasattr(SliceWorkflow.run, "__temporal_workflow_run")
 
+    @pytest.mark.asyncio
+    async def test_slice_without_parent_skips_progress_signal(self, monkeypatch) -> None:
+        """A standalone slice (empty parent_workflow_id) sends no parent signal."""
+        external_handles: list[str] = []
+
+        async def no_complete_signal(fn, *, timeout):
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr("aura_protocol.workflow.workflow.wait_condition", no_complete_signal)
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.get_external_workflow_handle",
+            external_handles.append,
+        )
+        result = await SliceWorkflow().run(
+            SliceInput(epoch_id="ep-1", slice_id="slice-1", phase_spec="p9", parent_workflow_id="")
+        )
+
+        assert result == SliceResult(slice_id="slice-1", success=True)
+        assert external_handles == []
+
 
 # ─── ReviewPhaseWorkflow Type Tests ───────────────────────────────────────────
 
@@ -1566,14 +1658,14 @@ class TestReviewPhaseWorkflowTypes:
 class TestReviewPhaseWorkflowSignalLogic:
     """Unit tests for ReviewPhaseWorkflow vote accumulation logic.
 
-    Tests the internal _votes dict and wait condition by directly calling the
+    Tests the internal _votes slots and wait condition by directly calling the
     signal handler and inspecting state — no Temporal server required.
     """
 
     def test_submit_vote_accumulates_votes(self) -> None:
         """submit_vote stores each axis vote in _votes."""
         wf = ReviewPhaseWorkflow()
-        assert wf._votes == {}
+        assert wf._vote_result() == {}
 
         # Simulate signal calls synchronously (signal is async but the mutation
         # is synchronous — drive the coroutine to completion with run_until_complete
@@ -1602,8 +1694,8 @@ class TestReviewPhaseWorkflowSignalLogic:
         finally:
             loop.close()
 
-        assert wf._votes[ReviewAxis.Correctness] == VoteType.Accept
-        assert wf._votes[ReviewAxis.TestQuality] == VoteType.Revise
+        assert wf._vote_result()[ReviewAxis.Correctness] == VoteType.Accept
+        assert wf._vote_result()[ReviewAxis.TestQuality] == VoteType.Revise
 
     def test_submit_vote_overwrites_duplicate_axis(self) -> None:
         """A second vote for the same axis overwrites the first."""
@@ -1633,7 +1725,7 @@ class TestReviewPhaseWorkflowSignalLogic:
             loop.close()
 
         # Second vote wins.
-        assert wf._votes[ReviewAxis.Elegance] == VoteType.Revise
+        assert wf._vote_result()[ReviewAxis.Elegance] == VoteType.Revise
 
     def test_vote_completeness_check(self) -> None:
         """All 3 ReviewAxis values must be present for the wait condition to be satisfied."""
@@ -1662,7 +1754,8 @@ class TestReviewPhaseWorkflowSignalLogic:
         finally:
             loop.close()
 
-        assert set(wf._votes.keys()) != all_axes, "Should not be complete with only 2 axes"
+        assert set(wf._vote_result().keys()) != all_axes, "Should not be complete with only 2 axes"
+        assert wf._all_voted() is False
 
         loop2 = _asyncio.new_event_loop()
         try:
@@ -1676,7 +1769,8 @@ class TestReviewPhaseWorkflowSignalLogic:
         finally:
             loop2.close()
 
-        assert set(wf._votes.keys()) >= all_axes, "Should be complete with all 3 axes"
+        assert set(wf._vote_result().keys()) >= all_axes, "Should be complete with all 3 axes"
+        assert wf._all_voted() is True
 
 
 # ─── Worker Registration Tests ─────────────────────────────────────────────────
@@ -1804,18 +1898,365 @@ class TestEpochWorkflowSliceProgressSignals:
         assert wf._slice_progress_log[1] is sig_b
 
 
-# ─── ReviewPhaseWorkflow _votes Type Tests ─────────────────────────────────────
+class TestEpochWorkflowPendingQueues:
+    """EpochWorkflow signal queues drain FIFO without a Temporal server."""
+
+    def test_pending_queues_start_empty(self) -> None:
+        """_pending_advance and _pending_votes are empty deques on init."""
+        wf = EpochWorkflow()
+        assert wf._pending_advance == deque()
+        assert wf._pending_votes == deque()
+        assert wf._has_work() is False
+
+    def test_has_work_true_when_vote_queued(self) -> None:
+        """_has_work (the run-loop wait predicate) sees a queued vote."""
+        wf = EpochWorkflow()
+        wf.submit_vote(ReviewVoteSignal(axis=ReviewAxis.Elegance, vote=VoteType.Accept, reviewer_id="r"))
+        assert wf._has_work() is True
+
+    def test_drain_votes_applies_in_arrival_order(self) -> None:
+        """_drain_votes empties the queue; a later vote on the same axis wins."""
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        wf.submit_vote(ReviewVoteSignal(axis=ReviewAxis.Correctness, vote=VoteType.Revise, reviewer_id="r1"))
+        wf.submit_vote(ReviewVoteSignal(axis=ReviewAxis.Correctness, vote=VoteType.Accept, reviewer_id="r1"))
+        wf._drain_votes()
+        assert not wf._pending_votes
+        assert wf._sm.state.review_votes == {ReviewAxis.Correctness: VoteType.Accept}
+
+
+class TestConstraintCheckPrefetch:
+    """EpochWorkflow starts constraint checks for queued advances ahead of apply."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_moves_queued_advances_in_order(self, monkeypatch) -> None:
+        scheduled: list[PhaseId] = []
+
+        def fake_start_local_activity(fn, *, args, start_to_close_timeout):
+            scheduled.append(args[1])
+            check = asyncio.get_running_loop().create_future()
+            check.set_result([])
+            return check
+
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.start_local_activity", fake_start_local_activity
+        )
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        sig_a = PhaseAdvanceSignal(to_phase=PhaseId.P2_Elicit, triggered_by="t", condition_met="c")
+        sig_b = PhaseAdvanceSignal(to_phase=PhaseId.P3_Propose, triggered_by="t", condition_met="c")
+        wf.advance_phase(sig_a)
+        wf.advance_phase(sig_b)
+
+        wf._prefetch_constraint_checks()
+
+        assert not wf._pending_advance
+        assert [sig for sig, _ in wf._checked_advances] == [sig_a, sig_b]
+        assert [await check for _, check in wf._checked_advances] == [[], []]
+        assert scheduled == [PhaseId.P2_Elicit, PhaseId.P3_Propose]
+
+    @pytest.mark.parametrize(
+        ("targets", "checked"),
+        [
+            # P3→P4 then P4→P3: the second is a real (backward) transition.
+            ((PhaseId.P4_Review, PhaseId.P3_Propose), [PhaseId.P4_Review, PhaseId.P3_Propose]),
+            # P3→P4 then P4→P4: the second is the self-transition.
+            ((PhaseId.P4_Review, PhaseId.P4_Review), [PhaseId.P4_Review]),
+        ],
+    )
+    def test_self_transition_detected_against_projected_phase(
+        self, monkeypatch, targets, checked
+    ) -> None:
+        scheduled: list[PhaseId] = []
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.start_local_activity",
+            lambda fn, *, args, start_to_close_timeout: scheduled.append(args[1]) or object(),
+        )
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        _advance_to(wf._sm, PhaseId.P3_Propose)
+        for to_phase in targets:
+            wf.advance_phase(PhaseAdvanceSignal(to_phase=to_phase, triggered_by="t", condition_met="c"))
+
+        wf._prefetch_constraint_checks()
+
+        assert scheduled == checked
+        assert [check is None for _, check in wf._checked_advances] == [
+            False, targets[1] is targets[0]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_checked_advances_cancels_in_flight_checks(self) -> None:
+        loop = asyncio.get_running_loop()
+        pending, done = loop.create_future(), loop.create_future()
+        done.set_result([])
+        sig = PhaseAdvanceSignal(to_phase=PhaseId.P2_Elicit, triggered_by="t", condition_met="c")
+        wf = EpochWorkflow()
+        wf._checked_advances.extend([(sig, pending), (sig, None), (sig, done)])
+
+        await wf._cancel_checked_advances()
+
+        assert not wf._checked_advances
+        assert pending.cancelled()
+        assert done.result() == []
+
+    def test_check_gets_detached_state(self, monkeypatch) -> None:
+        scheduled_states: list[EpochState] = []
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.start_local_activity",
+            lambda fn, *, args, start_to_close_timeout: scheduled_states.append(args[0]),
+        )
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        wf.advance_phase(PhaseAdvanceSignal(to_phase=PhaseId.P2_Elicit, triggered_by="t", condition_met="c"))
+
+        wf._prefetch_constraint_checks()
+        wf._sm.advance(PhaseId.P2_Elicit, triggered_by="t", condition_met="c")
+
+        (scheduled,) = scheduled_states
+        assert scheduled is not wf._sm.state
+        assert scheduled.current_phase == PhaseId.P1_Request
+        assert scheduled.transition_history == []
+        assert scheduled.completed_phases == set()
+
+    def test_self_transition_skips_check(self, monkeypatch) -> None:
+        scheduled: list[PhaseId] = []
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.start_local_activity",
+            lambda fn, *, args, start_to_close_timeout: scheduled.append(args[1]),
+        )
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        noop = PhaseAdvanceSignal(to_phase=PhaseId.P1_Request, triggered_by="t", condition_met="c")
+        wf.advance_phase(noop)
+
+        wf._prefetch_constraint_checks()
+
+        assert list(wf._checked_advances) == [(noop, None)]
+        assert scheduled == []
+        # The check is skipped only because it could never report anything.
+        assert RuntimeConstraintChecker().check_transition(wf._sm.state, PhaseId.P1_Request) == []
+
+
+class TestAvailableTransitionsMemo:
+    """EpochWorkflow.available_transitions query is memoized per state version."""
+
+    def test_query_reuses_cached_list_until_state_changes(self) -> None:
+        wf = EpochWorkflow()
+        wf._sm = _make_sm()
+        _advance_to(wf._sm, PhaseId.P4_Review)
+
+        first = wf.available_transitions()
+        assert wf.available_transitions() is first
+
+        wf.submit_vote(ReviewVoteSignal(axis=ReviewAxis.Correctness, vote=VoteType.Revise, reviewer_id="r"))
+        wf._drain_votes()
+        after_vote = wf.available_transitions()
+        assert after_vote is not first
+        assert isinstance(after_vote, tuple)
+        assert list(after_vote) == wf._sm.available_transitions
+
+
+class TestSearchAttributeDiffUpsert:
+    """EpochWorkflow only upserts search attributes whose value changed."""
+
+    def test_unchanged_attributes_are_not_resent(self, monkeypatch) -> None:
+        upserts: list[list] = []
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.upsert_search_attributes", upserts.append
+        )
+        wf = EpochWorkflow()
+        wf._upsert_changed_search_attributes({SA_PHASE: "p1", SA_ROLE: "epoch"})
+        wf._upsert_changed_search_attributes({SA_PHASE: "p2", SA_ROLE: "epoch"})
+        wf._upsert_changed_search_attributes({SA_PHASE: "p2", SA_ROLE: "epoch"})
+
+        assert len(upserts) == 2
+        assert [u.key.name for u in upserts[0]] == ["AuraPhase", "AuraRole"]
+        assert [(u.key.name, u.value) for u in upserts[1]] == [("AuraPhase", "p2")]
+
+    def test_closed_set_values_reuse_prebuilt_updates(self, monkeypatch) -> None:
+        upserts: list[list] = []
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.upsert_search_attributes", upserts.append
+        )
+        wf = EpochWorkflow()
+        wf._upsert_changed_search_attributes({SA_STATUS: "complete", SA_EPOCH_ID: "e-1"})
+        wf2 = EpochWorkflow()
+        wf2._upsert_changed_search_attributes({SA_STATUS: "complete", SA_EPOCH_ID: "e-2"})
+
+        assert upserts[0][0] is upserts[1][0]
+        assert upserts[0][1].value == "e-1"
+        assert upserts[1][1].value == "e-2"
+
+    def test_phase_sa_strings_match_enum_values(self) -> None:
+        from aura_protocol.workflow import _PHASE_SA_STR
+
+        assert set(_PHASE_SA_STR) == set(PhaseId)
+        for phase, (phase_str, status_str, domain_str) in _PHASE_SA_STR.items():
+            assert phase_str == phase.value
+            assert status_str == ("complete" if phase == PhaseId.Complete else "running")
+            assert domain_str == (PHASE_DOMAIN[phase].value if phase in PHASE_DOMAIN else "")
+
+
+class TestContinueAsNewCheckpoint:
+    """EpochWorkflow hands its state to the next run on continue-as-new."""
+
+    def _advanced_workflow(self) -> EpochWorkflow:
+        wf = EpochWorkflow()
+        wf._sm = EpochStateMachine("e-can")
+        wf._sm.advance(PhaseId.P2_Elicit, triggered_by="test", condition_met="ok")
+        wf._successful_count = 1
+        wf._failed_count = 2
+        wf._total_violations = 3
+        wf._pending_advance.append(PhaseAdvanceSignal(to_phase=PhaseId.P3_Propose, triggered_by="test", condition_met="ok"))
+        wf._active_sessions.append(SessionRegisterSignal(epoch_id="e-can", session_id="s-1"))
+        wf._slice_progress_log.append(
+            SliceProgressSignal(slice_id="s", leaf_task_id="t", stage_name="x", completed=True)
+        )
+        return wf
+
+    def test_threshold_triggers_continue_as_new(self, monkeypatch) -> None:
+        history_length = EpochWorkflow._CAN_THRESHOLD_EVENTS
+        info = SimpleNamespace(get_current_history_length=lambda: history_length)
+        monkeypatch.setattr("aura_protocol.workflow.workflow.info", lambda: info)
+        wf = EpochWorkflow()
+        assert not wf._should_continue_as_new()
+
+        history_length += 1
+        assert wf._should_continue_as_new()
+
+        history_length = 0
+        monkeypatch.setattr(EpochWorkflow, "_CAN_THRESHOLD_LOG_LEN", 0)
+        wf._slice_progress_log.append(
+            SliceProgressSignal(slice_id="s", leaf_task_id="t", stage_name="x", completed=True)
+        )
+        assert wf._should_continue_as_new()
+
+    def test_checkpoint_keeps_transition_history(self) -> None:
+        wf = self._advanced_workflow()
+        checkpoint = wf._checkpoint()
+
+        assert checkpoint.state.current_phase == PhaseId.P2_Elicit
+        assert checkpoint.state.transition_history == wf._sm.state.transition_history
+        assert checkpoint.state.transition_history is not wf._sm.state.transition_history
+        assert checkpoint.pending_advance == tuple(wf._pending_advance)
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_history_covers_unpersisted_transitions(self, monkeypatch) -> None:
+        # persist_transitions defaults to off, so the checkpoint must hold
+        # every applied record — succeeded or failed — itself.
+        async def fake_execute_activity(*args, **kwargs) -> None:
+            return None
+
+        monkeypatch.setattr("aura_protocol.workflow.workflow.now", lambda: None)
+        monkeypatch.setattr(
+            "aura_protocol.workflow.workflow.execute_activity", fake_execute_activity
+        )
+        wf = EpochWorkflow()
+        wf._sm = EpochStateMachine("e-can")
+        for to_phase in (PhaseId.P2_Elicit, PhaseId.P9_Slice):
+            await wf._apply_advance(
+                "e-can", PhaseAdvanceSignal(to_phase=to_phase, triggered_by="t", condition_met="c")
+            )
+
+        checkpoint = wf._checkpoint()
+        assert len(checkpoint.state.transition_history) == wf._successful_count + wf._failed_count == 2
+        assert [r.success for r in checkpoint.state.transition_history] == [True, False]
+
+    def test_persisted_history_is_trimmed_across_rollovers(self) -> None:
+        from temporalio.converter import DataConverter
+
+        async def encoded_size(checkpoint: EpochCheckpoint) -> int:
+            return len((await DataConverter.default.encode([checkpoint]))[0].data)
+
+        wf = EpochWorkflow()
+        wf._sm = EpochStateMachine("e-can")
+        sizes: list[int] = []
+        for target in (PhaseId.P4_Review, PhaseId.P9_Slice):
+            # One generation: advance, then continue-as-new with persistence on.
+            _advance_to(wf._sm, target)
+            checkpoint = wf._checkpoint(trim_persisted=True)
+            assert checkpoint.state.transition_history == wf._sm.state.transition_history[-1:]
+            assert RuntimeConstraintChecker().check_audit_trail(checkpoint.state) == []
+            sizes.append(asyncio.run(encoded_size(checkpoint)))
+            wf = EpochWorkflow()
+            wf._restore_checkpoint(checkpoint)
+
+        # The second generation advanced through more phases, yet its
+        # checkpoint is no larger (modulo completed_phases growth).
+        assert len(wf._sm.state.transition_history) == 1
+        assert sizes[1] - sizes[0] < 200
+
+    def test_resumed_run_reports_full_transition_history(self) -> None:
+        from temporalio.converter import DataConverter
+
+        wf = self._advanced_workflow()
+        history_before = wf.current_state().transition_history
+
+        async def round_trip() -> EpochCheckpoint:
+            payloads = await DataConverter.default.encode([wf._checkpoint()])
+            return (await DataConverter.default.decode(payloads, [EpochCheckpoint]))[0]
+
+        resumed = EpochWorkflow()
+        resumed._restore_checkpoint(asyncio.run(round_trip()))
+
+        state = resumed.current_state()
+        assert state.transition_history == history_before
+        assert RuntimeConstraintChecker().check_audit_trail(state) == []
+
+    def test_restore_resumes_counts_and_queued_signals(self) -> None:
+        checkpoint = self._advanced_workflow()._checkpoint()
+        resumed = EpochWorkflow()
+        late = PhaseAdvanceSignal(to_phase=PhaseId.P4_Review, triggered_by="test", condition_met="ok")
+        resumed._pending_advance.append(late)
+        resumed._active_sessions.append(SessionRegisterSignal(epoch_id="e-can", session_id="s-1"))
+
+        resumed._restore_checkpoint(checkpoint)
+
+        assert resumed._sm.state.current_phase == PhaseId.P2_Elicit
+        assert (resumed._successful_count, resumed._failed_count) == (1, 2)
+        assert resumed._total_violations == 3
+        assert list(resumed._pending_advance) == [*checkpoint.pending_advance, late]
+        assert [s.session_id for s in resumed._active_sessions] == ["s-1"]
+
+    def test_checkpoint_round_trips_through_payload_converter(self) -> None:
+        from temporalio.converter import DataConverter
+
+        epoch_input = EpochInput(
+            epoch_id="e-can",
+            request_description="resume",
+            resume=self._advanced_workflow()._checkpoint(),
+        )
+
+        async def round_trip() -> EpochInput:
+            payloads = await DataConverter.default.encode([epoch_input])
+            return (await DataConverter.default.decode(payloads, [EpochInput]))[0]
+
+        decoded = asyncio.run(round_trip())
+        assert isinstance(decoded.resume, EpochCheckpoint)
+        assert decoded == epoch_input
+
+
+class TestWorkflowSlots:
+    """Workflow classes with hot signal handlers use a fixed slot layout."""
+
+    @pytest.mark.parametrize("workflow_cls", [EpochWorkflow, ReviewPhaseWorkflow])
+    def test_instances_have_no_dict(self, workflow_cls) -> None:
+        assert not hasattr(workflow_cls(), "__dict__")
+
+
+# ─── ReviewPhaseWorkflow Vote Result Type Tests ────────────────────────────────
 
 
 class TestReviewPhaseWorkflowVotesType:
-    """Verify ReviewPhaseWorkflow._votes uses ReviewAxis keys and VoteType values.
+    """Verify ReviewPhaseWorkflow vote results use ReviewAxis keys and VoteType values.
 
-    AC: Given ReviewPhaseWorkflow when votes then _votes uses ReviewAxis keys
+    AC: Given ReviewPhaseWorkflow when votes then _vote_result() uses ReviewAxis keys
         and VoteType values — use ReviewAxis.Correctness (not .value).
     """
 
     def test_votes_keys_are_review_axis(self) -> None:
-        """_votes keys must be ReviewAxis instances, not plain strings."""
+        """_vote_result() keys must be ReviewAxis instances, not plain strings."""
         wf = ReviewPhaseWorkflow()
         import asyncio as _asyncio
         loop = _asyncio.new_event_loop()
@@ -1833,13 +2274,13 @@ class TestReviewPhaseWorkflowVotesType:
             loop.close()
 
         # Key must be ReviewAxis, not raw str (though StrEnum == str by value)
-        keys = list(wf._votes.keys())
+        keys = list(wf._vote_result().keys())
         assert len(keys) == 1
         assert isinstance(keys[0], ReviewAxis)
         assert keys[0] == ReviewAxis.Correctness
 
     def test_votes_values_are_vote_type(self) -> None:
-        """_votes values must be VoteType instances, not plain strings."""
+        """_vote_result() values must be VoteType instances, not plain strings."""
         wf = ReviewPhaseWorkflow()
         import asyncio as _asyncio
         loop = _asyncio.new_event_loop()
@@ -1856,7 +2297,7 @@ class TestReviewPhaseWorkflowVotesType:
         finally:
             loop.close()
 
-        vals = list(wf._votes.values())
+        vals = list(wf._vote_result().values())
         assert len(vals) == 1
         assert isinstance(vals[0], VoteType)
         assert vals[0] == VoteType.Revise